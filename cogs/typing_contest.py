@@ -1,38 +1,77 @@
+import asyncio
+import functools
+import io
 import json
+import logging
+import time
 from datetime import datetime, timedelta
 
 import discord
 from discord.ext import commands, tasks
 
 from constants import (
+    ALL_HEATS_FINISHED,
     ALL_SUBMITTED_SUCCESS,
-    ALREADY_JOINED,
     BAN_SUCCESS,
-    BANNED_USER_TRY_JOIN,
     CHECKMARK_EMOJI,
-    CONFIG_JSON_FILE_PATH,
+    CONFIRM_SUCCESS,
     CONTEST_ALREADY_ACTIVE,
     END_SUCCESS,
+    FINAL_START_SUCCESS,
+    HEAT_START_SUCCESS,
+    HEATS_NOT_FINISHED,
+    HEATS_START_SUCCESS,
+    HOLD_SUCCESS,
     IDLE_THRESHOLD_MINUTES,
-    INVALID_WPM,
+    IMAGES_DISABLED,
+    IMAGES_ENABLED,
+    IMAGES_UNAVAILABLE,
     JOIN_SUCCESS,
-    MEMBER_NOT_IN_CONTEST,
     MEMBER_NOT_IN_GUILD,
-    MUST_SUBMIT_WPM,
     NO_ACTIVE_CONTEST,
+    NO_ACTIVE_TOURNAMENT,
     NO_PARTICIPANTS,
+    NO_QUALIFIERS,
+    NO_REGISTRANTS,
+    NOT_BOT_OWNER,
     NOT_CONTEST_CREATOR,
-    NOT_IN_CONTEST,
+    NOT_IN_ANY_HEAT,
+    NOT_RATED,
     PARTICIPANT_ROLE_NAME,
     QUIT_SUCCESS,
     RANKING_EMOJIS,
+    RATING_INFO,
+    REGISTER_SUCCESS,
+    REGISTRANT_COUNT,
+    REGISTRATION_CLOSED,
+    RELOAD_FAILED,
+    RELOAD_SUCCESS,
     REMINDER_SUCCESS,
     REMOVE_SUCCESS,
-    ROUND_NOT_STARTED,
+    RESULT_IMAGE_FILENAME,
+    SCOREBOARD_LINK,
     START_SUCCESS,
     STATUS_ACTIVE,
     STATUS_INACTIVE,
+    TOURNAMENT_ALREADY_ACTIVE,
+    TOURNAMENT_CANCEL_SUCCESS,
+    TOURNAMENT_END_SUCCESS,
+    TOURNAMENT_LEADERBOARD_SIZE,
+    TOURNAMENT_NO_HEAT_CHANNELS,
+    TOURNAMENT_QUALIFIERS_PER_HEAT,
+    TOURNAMENT_START_SUCCESS,
+    TOURNAMENT_USAGE,
+    TOURNAMENT_WRONG_STAGE,
+    UNREGISTER_SUCCESS,
+    WPM_FLAGGED,
+    YOUR_HEAT,
 )
+from contest import Contest, ContestError, format_wpm_result_table
+from contest_state import ContestState
+from tournament import STAGE_HEATS, STAGE_REGISTRATION, Tournament
+from utils.member_index import ContestMember
+from utils.result_image import images_available
+from utils.scoreboard import LiveScoreboard
 
 IDLE_THRESHOLD = timedelta(minutes=IDLE_THRESHOLD_MINUTES)
 
@@ -43,60 +82,185 @@ class TypingContestBot(commands.Cog):
     This bot allows users to join a typing contest, track their typing speed
     (WPM), and display the results after each round.
 
+    The state of each contest lives in a `Contest`, which applies every state
+    change in order; the commands here validate the request, submit the change
+    and then talk to Discord. A contest is either standalone or one of the
+    heats or the final of a `Tournament`.
+
+    Everything that must outlive the cog is kept in a `ContestState` owned by
+    the bot, so the cog can be hot reloaded with `!reload` without losing any
+    contest.
+
     Attributes:
         bot: The Discord bot instance.
-        debug: Debug flag for testing purposes.
-        contest_active: Indicates whether a contest is currently active.
-        contest_creator: The user who started the contest.
-        contest_channel: The channel where the contest is being held.
-        participants: The set of participants in the contest.
-        banned_participants: The set of banned participants.
-        round: The current round number.
-        last_next_used: Indicates whether the `!next` command was used in the last round.
-        wpm_results: WPM results for each participant.
-        top_three_participants: The top three participant based on average WPM.
+        state: The contests and everything else kept across reloads.
         ranking_emojis: Emojis used to represent rankings.
-        participant_role: The temporary role assigned to participants during the contest.
-        last_activity_time: The last time an activity was recorded during the contest.
     """
 
-    def __init__(self, bot: commands.Bot, debug: bool) -> None:
+    def __init__(self, bot: commands.Bot, state: ContestState) -> None:
         """Initialize the TypingContestBot cog.
 
         Args:
             bot: The bot instance.
-            debug: If true, enable debugging behavior.
+            state: The state to run the contests from, possibly handed over
+                by a previous version of the cog.
         """
         self.bot: commands.Bot = bot
-        self.debug: bool = debug
-        self.contest_active: bool = False
-        self.contest_creator: discord.Member | None = None
-        self.contest_channel: discord.TextChannel | None = None
-        self.participants: set[discord.Member] = set()
-        self.banned_participants: set[discord.Member] = set()
-        self.round: int = 0
-        self.last_next_used: bool = False
-        self.wpm_results: dict[discord.Member, list[str]] = {}
-        self.top_three_participants: list[tuple[discord.Member, float]] = []
+        self.state: ContestState = state
         self.ranking_emojis: list[str] = RANKING_EMOJIS
-        self.participant_role: discord.Role | None = None
-        self.last_activity_time: datetime = datetime.now()
         self.check_idle_status.start()
 
+    async def cog_before_invoke(self, ctx) -> None:
+        """Record the command to the trace before it is invoked.
+
+        Args:
+            ctx: The command context.
+        """
+        if self.state.trace_recorder:
+            self.state.trace_recorder.record_command(ctx)
+
+    async def cog_load(self) -> None:
+        """Take over the live scoreboards from a previous version of the cog."""
+        for channel_id, scoreboard in self.state.scoreboards.items():
+            contest = self.state.contests[channel_id]
+            scoreboard.render = functools.partial(
+                self.render_scoreboard, contest
+            )
+
+    async def cog_unload(self) -> None:
+        """Stop the idle check.
+
+        The state is left running, for the next version of the cog or for
+        the bot to close.
+        """
+        self.check_idle_status.cancel()
+
+    def snapshot_state(self) -> dict:
+        """Return a JSON-compatible snapshot of the contest state.
+
+        Returns:
+            dict: The snapshots of the active contests by channel ID, and of
+            the running tournament, if any.
+        """
+        return self.state.snapshot()
+
+    def is_active(self) -> bool:
+        """Check whether a contest or tournament is running.
+
+        Returns:
+            bool: True if any contest is active or a tournament is running.
+        """
+        return self.state.tournament is not None or any(
+            contest.active for contest in self.state.contests.values()
+        )
+
+    def open_contest(self, contest: Contest) -> None:
+        """Make a contest reachable from its channel.
+
+        Args:
+            contest: The contest to open.
+        """
+        self.state.contests[contest.channel.id] = contest
+        self.bot.dispatch_filter.add_contest_channel(contest.channel.id)
+
+    def close_contest(self, contest: Contest) -> None:
+        """Stop routing commands from its channel to a finished contest.
+
+        Args:
+            contest: The finished contest.
+        """
+        if self.state.contests.get(contest.channel.id) is contest:
+            del self.state.contests[contest.channel.id]
+        if not (
+            self.state.tournament
+            and contest.channel == self.state.tournament.channel
+        ):
+            self.bot.dispatch_filter.remove_contest_channel(contest.channel.id)
+
+    async def render_scoreboard(self, contest: Contest) -> str | None:
+        """Render the live scoreboard of a contest.
+
+        Args:
+            contest: The contest.
+
+        Returns:
+            str | None: The scoreboard content, or None once the contest has
+            ended.
+        """
+        try:
+            wpm_result_table = await contest.submit(
+                contest.get_wpm_result_table
+            )
+        except ContestError:
+            return None
+        return f"## Live WPM result table\n\n```{wpm_result_table}```"
+
+    def refresh_scoreboard(self, contest: Contest) -> None:
+        """Flag the live scoreboard of a contest as out of date, if it has one.
+
+        Args:
+            contest: The contest whose state changed.
+        """
+        scoreboard = self.state.scoreboards.get(contest.channel.id)
+        if scoreboard is not None:
+            scoreboard.mark_changed()
+
+    async def format_results(
+        self,
+        wpm_result_rows: list[list[str]],
+        as_image: bool,
+        podium: list[tuple[discord.Member, float]] | None = None,
+    ) -> tuple[str, discord.File | None]:
+        """Format a WPM result table for sending, as text or as an image.
+
+        Args:
+            wpm_result_rows: The header row followed by one row per
+                participant.
+            as_image: Whether to render the table as an image.
+            podium: The top participants with their average WPM, drawn above
+                the table when rendering an image.
+
+        Returns:
+            tuple[str, discord.File | None]: The message content and the image
+            to attach, if any.
+        """
+        if not as_image:
+            wpm_result_table = format_wpm_result_table(wpm_result_rows)
+            return f"## WPM result table\n\n```{wpm_result_table}```", None
+
+        try:
+            image = await self.state.result_images.render(
+                wpm_result_rows,
+                [
+                    (participant.display_name, average_wpm)
+                    for participant, average_wpm in podium or []
+                ],
+            )
+        except Exception:
+            # A dead worker, or a Pillow too old to render the table, must not
+            # stop the results from being posted
+            logging.getLogger("discord").exception(
+                "Rendering a result image failed, posting the table as text"
+            )
+            return await self.format_results(wpm_result_rows, as_image=False)
+        return "## WPM result table", discord.File(
+            io.BytesIO(image), filename=RESULT_IMAGE_FILENAME
+        )
+
     def load_config(self) -> dict:
         """Load configuration from the config file
 
         Returns:
             dict: The loaded configuration as a dictionary.
         """
-        with open(CONFIG_JSON_FILE_PATH) as file:
+        with open(self.state.config_file_path) as file:
             return json.load(file)
 
     def update_contest_held(self) -> None:
         """Increment and update the total number of contests held in the config file."""
         config = self.load_config()
         config["contests_held"] += 1
-        with open(CONFIG_JSON_FILE_PATH, "w") as file:
+        with open(self.state.config_file_path, "w") as file:
             json.dump(config, file, indent=4)
 
     async def update_presence(self) -> None:
@@ -109,16 +273,12 @@ class TypingContestBot(commands.Cog):
 
     @tasks.loop(minutes=1)
     async def check_idle_status(self) -> None:
-        """Periodically check if the contest has been idle for too long."""
-        if (
-            self.contest_active
-            and self.contest_creator
-            and self.contest_channel
-        ):
-            idle_time = datetime.now() - self.last_activity_time
-            if idle_time > IDLE_THRESHOLD:
-                await self.contest_channel.send(
-                    f"{self.contest_creator.mention}, the contest has been idle for more than {IDLE_THRESHOLD_MINUTES} minutes."
+        """Periodically check if any contest has been idle for too long."""
+        for contest in list(self.state.contests.values()):
+            idle_time = datetime.now() - contest.last_activity_time
+            if contest.active and idle_time > IDLE_THRESHOLD:
+                await contest.channel.send(
+                    f"{contest.creator.mention}, the contest has been idle for more than {IDLE_THRESHOLD_MINUTES} minutes."
                 )
 
     @check_idle_status.before_loop
@@ -126,27 +286,22 @@ class TypingContestBot(commands.Cog):
         """Wait until the bot is ready before starting the idle check."""
         await self.bot.wait_until_ready()
 
-    def update_activity_time(self) -> None:
-        """Update the last activity time to the current time."""
-        self.last_activity_time = datetime.now()
-
-    async def validate_contest_status(self, ctx) -> bool:
+    async def validate_contest_status(self, ctx) -> Contest | None:
         """Validates if a contest is active and if the command is issued in the correct channel.
 
         Args:
             ctx: The command context.
 
         Return:
-            bool: True if in the contest channel and the contest is active; False otherwise.
+            Contest | None: The active contest of the channel; None otherwise.
         """
-        if not self.contest_active:
-            await ctx.reply(NO_ACTIVE_CONTEST)
-            return False
+        contest = self.state.contests.get(ctx.channel.id)
+        if contest is not None and contest.active:
+            return contest
 
-        if ctx.channel != self.contest_channel:
-            return False
-
-        return True
+        if not any(contest.active for contest in self.state.contests.values()):
+            await ctx.reply(NO_ACTIVE_CONTEST)
+        return None
 
     async def get_typist_role(self, ctx) -> discord.Role:
         """Retrieve the typist role for the current server
@@ -161,19 +316,20 @@ class TypingContestBot(commands.Cog):
         """
         config = self.load_config()
         role_name = config[
-            "testing_role_name" if self.debug else "typist_role_name"
+            "testing_role_name" if self.state.debug else "typist_role_name"
         ]
         role = discord.utils.get(ctx.guild.roles, name=role_name)
 
         if role is None:
-            role = ctx.guild.create_role(name=role_name)
+            role = await ctx.guild.create_role(name=role_name)
         return role
 
     async def create_participant_role(self, ctx) -> None:
         """Create the temporary participant role for the typing contest.
 
         This method checks if the participant role already exists. If the role
-        does not exist, it creates a new one with the name specified by
+        does not exist, it creates a new one, at most once even when called
+        concurrently, with the name specified by
         `PARTICIPANT_ROLE_NAME`. The role is intended to be temporary for
         contest participants.
 
@@ -184,23 +340,55 @@ class TypingContestBot(commands.Cog):
         Returns:
             None: The method does not return a value.
         """
-        if self.participant_role:
-            return
+        async with self.state.participant_role_lock:
+            if self.state.participant_role:
+                return
 
-        guild = ctx.guild
-        self.participant_role = discord.utils.get(
-            guild.roles, name=PARTICIPANT_ROLE_NAME
-        )
-        if self.participant_role is None:
-            self.participant_role = await guild.create_role(
-                name=PARTICIPANT_ROLE_NAME, reason="Temporary contest role"
+            guild = ctx.guild
+            self.state.participant_role = discord.utils.get(
+                guild.roles, name=PARTICIPANT_ROLE_NAME
             )
+            if self.state.participant_role is None:
+                self.state.participant_role = await guild.create_role(
+                    name=PARTICIPANT_ROLE_NAME, reason="Temporary contest role"
+                )
         return
 
+    def in_active_contest(self, member: discord.Member) -> bool:
+        """Check whether a member takes part in any active contest.
+
+        Args:
+            member: The member.
+
+        Returns:
+            bool: True if the member is a participant of an active contest.
+        """
+        return any(
+            contest.active and member in contest.participants
+            for contest in self.state.contests.values()
+        )
+
+    def participant_role_lock(self, member: discord.Member) -> asyncio.Lock:
+        """Return the lock serializing a member's participant role changes.
+
+        Args:
+            member: The member.
+
+        Returns:
+            asyncio.Lock: The lock, shared by every change in flight for the
+            member. The caller must hold on to it while using it.
+        """
+        lock = self.state.participant_role_locks.get(member.id)
+        if lock is None:
+            lock = self.state.participant_role_locks[member.id] = asyncio.Lock()
+        return lock
+
     async def assign_participant_role(self, member: discord.Member) -> None:
         """Assign the participant role to the specified member.
 
-        This method adds the temporary participant role to the provided member.
+        This method adds the temporary participant role to the provided member,
+        unless they have left every active contest by the time their earlier
+        role changes are done.
 
         Args:
             member: The discord.Member to which the participant role will be
@@ -209,14 +397,19 @@ class TypingContestBot(commands.Cog):
         Returns:
             None: The method does not return a value.
         """
-        if self.participant_role:
-            await member.add_roles(self.participant_role)
+        if self.state.participant_role:
+            async with self.participant_role_lock(member):
+                if self.in_active_contest(member):
+                    await member.add_roles(self.state.participant_role)
 
     async def remove_participant_role(self, member: discord.Member) -> None:
         """Remove the participant role from the specified member.
 
         This method removes the temporary participant role from the provided
-        member.
+        member, unless they have joined another active contest by the time
+        their earlier role changes are done. All contests share the role, so
+        a contest that ended must not take it from its typists who already
+        joined the next one.
 
         Args:
             member: The discord.Member from whom the participant role will be
@@ -225,68 +418,112 @@ class TypingContestBot(commands.Cog):
         Returns:
             None: The method does not return a value.
         """
-        if self.participant_role:
-            await member.remove_roles(self.participant_role)
+        if self.state.participant_role:
+            async with self.participant_role_lock(member):
+                if not self.in_active_contest(member):
+                    await member.remove_roles(self.state.participant_role)
 
-    def get_wpm_result_table(self) -> str:
-        """Generate and return a table of WPM results for all participants.
+    async def reply_error(self, ctx, error: ContestError) -> None:
+        """Reply to a command that its contest transition was rejected.
+
+        Args:
+            ctx: The command context.
+            error: The error raised by the transition.
+        """
+        await ctx.reply(error.reply)
+
+    def registering_tournament(self, ctx) -> Tournament | None:
+        """Return the tournament if the command was sent to its registration.
+
+        Args:
+            ctx: The command context.
 
         Returns:
-            str: The formatted WPM result table.
+            Tournament | None: The tournament if it is taking registrations
+            in the command's channel; None otherwise.
         """
-        wpm_result_rows = [
-            ["Typist \\ Round"]
-            + [str(i + 1) for i in range(self.round)]
-            + ["Avg WPM"]
-        ]
+        tournament = self.state.tournament
+        if (
+            tournament is not None
+            and tournament.stage == STAGE_REGISTRATION
+            and ctx.channel == tournament.channel
+        ):
+            return tournament
+        return None
 
-        participant_averages: dict[discord.Member, float] = {}
+    def finish_tournament_contest(self, contest: Contest) -> Tournament | None:
+        """Record a finished contest in the tournament it belongs to.
 
-        for participant, wpm_list in self.wpm_results.items():
-            row = [participant.display_name]
-            row.extend(wpm_list)
-            average_wpm = "NQ"  # Not Qualified
+        This must be called right after the contest has been committed as
+        finished, before any I/O, so the tournament moves on atomically.
 
-            if len(row) - 1 < self.round:
-                # Fill in the missing rounds with blank spaces
-                row.extend(["" for _ in range(self.round - len(row) + 1)])
-            elif len(wpm_list) and "-" not in wpm_list:
-                # Compute average WPM if valid
-                wpm_int_list = [int(wpm) for wpm in wpm_list]
-                average_wpm = f"{sum(wpm_int_list) / self.round:.2f}"
-                participant_averages[participant] = float(average_wpm)
+        Args:
+            contest: The finished contest.
 
-            row.append(average_wpm)
+        Returns:
+            Tournament | None: The tournament the contest belonged to, or None
+            if it was a standalone contest.
+        """
+        tournament = self.state.tournament
+        if tournament is None:
+            return None
+
+        if contest is tournament.final:
+            self.state.tournament = None
+            self.bot.dispatch_filter.remove_contest_channel(
+                tournament.channel.id
+            )
+            return tournament
 
-            wpm_result_rows.append(row)
+        if tournament.heats.get(contest.channel.id) is contest:
+            tournament.record_heat(contest)
+            return tournament
 
-        self.top_three_participants = sorted(
-            participant_averages.items(), key=lambda x: x[1], reverse=True
-        )[:3]
+        return None
 
-        # Transpose table for formatting
-        transposed_table = list(zip(*wpm_result_rows))
-        max_column_lengths = [
-            max(len(item) for item in column) for column in transposed_table
-        ]
+    def format_leaderboard(self, tournament: Tournament) -> str:
+        """Format the overall leaderboard of a tournament.
+
+        Args:
+            tournament: The tournament.
 
-        # Insert row of dashes after headers
-        wpm_result_rows.insert(1, ["-" * len for len in max_column_lengths])
-
-        # Format each row
-        formatted_rows = [
-            "| "
-            + " | ".join(
-                item.ljust(max_column_lengths[i])
-                if i == 0
-                else item.rjust(max_column_lengths[i])
-                for i, item in enumerate(row)
+        Returns:
+            str: The top of the leaderboard, one typist per line.
+        """
+        leaderboard = tournament.leaderboard()
+        if not leaderboard:
+            return "No typists with valid WPM data."
+
+        lines = []
+        for i, (member, stage, average_wpm) in enumerate(
+            leaderboard[:TOURNAMENT_LEADERBOARD_SIZE]
+        ):
+            rank = self.ranking_emojis[i] if i < 3 else f"{i + 1}."
+            lines.append(
+                f"{rank} {member.mention} - {average_wpm:.2f} WPM ({stage})"
             )
-            + " |"
-            for row in wpm_result_rows
-        ]
+        if len(leaderboard) > TOURNAMENT_LEADERBOARD_SIZE:
+            lines.append(
+                f"...and {len(leaderboard) - TOURNAMENT_LEADERBOARD_SIZE} more"
+            )
+        return "## Tournament leaderboard\n\n" + "\n".join(lines)
+
+    async def announce_tournament_progress(
+        self, tournament: Tournament, contest: Contest
+    ) -> None:
+        """Announce what happens next after a tournament contest ended.
 
-        return "\n".join(formatted_rows)
+        Args:
+            tournament: The tournament the contest belonged to.
+            contest: The finished heat or final.
+        """
+        if contest is tournament.final:
+            await tournament.channel.send(self.format_leaderboard(tournament))
+            await tournament.channel.send(TOURNAMENT_END_SUCCESS)
+        elif len(tournament.heat_averages) == len(tournament.heats):
+            await tournament.channel.send(
+                ALL_HEATS_FINISHED.format(creator=tournament.creator.mention)
+            )
 
     @commands.Cog.listener()
     async def on_ready(self) -> None:
@@ -304,88 +541,103 @@ class TypingContestBot(commands.Cog):
         Args:
             ctx: The command context.
         """
-        if self.contest_active:
+        if self.is_active():
             await ctx.reply(CONTEST_ALREADY_ACTIVE)
             return
 
-        self.contest_active = True
-        self.contest_creator = ctx.author
-        self.contest_channel = ctx.channel
+        self.open_contest(
+            Contest(ctx.author, ctx.channel, self.state.typist_stats)
+        )
 
-        if self.participant_role is None:
+        if self.state.participant_role is None:
             await self.create_participant_role(ctx)
 
         typist_role = await self.get_typist_role(ctx)
         await ctx.reply(START_SUCCESS.format(typist_role=typist_role.mention))
 
-        self.update_activity_time()
-
-    @commands.command(name="end")
+    @commands.command(name="end", extras={"contest_channel_only": True})
     async def end(self, ctx) -> None:
         """End the typing contest
 
         Only the contest creator can end the contest.
-        This command also shows the WPM result table and top three participants.
+        This command also shows the WPM result table and top three participants,
+        and updates the skill ratings of the qualified participants.
 
         Args:
             ctx: The command context.
         """
-        if not await self.validate_contest_status(ctx):
+        contest = await self.validate_contest_status(ctx)
+        if contest is None:
             return
 
-        if ctx.author != self.contest_creator:
+        if ctx.author != contest.creator:
             await ctx.reply(NOT_CONTEST_CREATOR)
             return
 
-        await ctx.reply(
-            END_SUCCESS.format(typist_role=self.participant_role.mention)
-        )
-
-        # Append "-" for participants without full results
-        for participant in self.participants:
-            if len(self.wpm_results[participant]) != self.round:
-                self.wpm_results[participant].append("-")
+        try:
+            (
+                wpm_result_rows,
+                top_three_participants,
+                participants,
+            ) = await contest.submit(contest.finish)
+        except ContestError as error:
+            await self.reply_error(ctx, error)
+            return
 
-        if self.last_next_used:
-            self.round -= 1
-            for participant in self.participants:
-                if self.wpm_results[participant]:
-                    self.wpm_results[participant].pop()
+        # The contest is over as soon as it is committed, before any I/O
+        self.close_contest(contest)
+        tournament = self.finish_tournament_contest(contest)
+        self.state.ratings.record_contest(
+            {
+                participant.id: average_wpm
+                for participant, average_wpm in contest.participant_averages.items()
+            }
+        )
+        if self.state.trace_recorder:
+            self.state.trace_recorder.record_result(
+                contest.channel.id, wpm_result_rows
+            )
+        scoreboard = self.state.scoreboards.pop(contest.channel.id, None)
+        as_image = contest.channel.id in self.state.image_channels
+        self.state.image_channels.discard(contest.channel.id)
 
-        wpm_result_table = self.get_wpm_result_table()
+        await ctx.reply(
+            END_SUCCESS.format(typist_role=self.state.participant_role.mention)
+        )
 
-        if self.top_three_participants:
+        if top_three_participants:
             top_three_result = "Top Participants by Avg WPM:\n" + "\n".join(
                 [
                     f"{self.ranking_emojis[i]} {participant.mention} - {average_wpm:.2f} WPM"
                     for i, (participant, average_wpm) in enumerate(
-                        self.top_three_participants
+                        top_three_participants
                     )
                 ]
             )
         else:
             top_three_result = "No participants with valid WPM data."
 
-        await ctx.send(
-            f"## WPM result table\n\n```{wpm_result_table}```\n{top_three_result}",
+        content, file = await self.format_results(
+            wpm_result_rows, as_image, top_three_participants
         )
+        await ctx.send(f"{content}\n{top_three_result}", file=file)
+
+        if scoreboard is not None:
+            wpm_result_table = format_wpm_result_table(wpm_result_rows)
+            await scoreboard.close(
+                f"## Final WPM result table\n\n```{wpm_result_table}```"
+            )
 
-        for participant in self.participants:
+        # Typists who already joined the next contest keep the role
+        for participant in participants:
             await self.remove_participant_role(participant)
 
-        # Reset contest state
-        self.contest_active = False
-        self.contest_creator = None
-        self.contest_channel = None
-        self.participants.clear()
-        self.banned_participants.clear()
-        self.round = 0
-        self.last_next_used = False
-        self.wpm_results = {}
-        self.top_three_participants = []
         self.update_contest_held()
         await self.update_presence()
 
+        if tournament is not None:
+            await self.announce_tournament_progress(tournament, contest)
+
     @commands.command(name="status")
     async def status(self, ctx) -> None:
         """Check the status of the typing contest.
@@ -396,83 +648,133 @@ class TypingContestBot(commands.Cog):
         Args:
             ctx: The command context.
         """
-        if self.contest_active:
+        if self.is_active():
             await ctx.reply(STATUS_ACTIVE)
         else:
             await ctx.reply(STATUS_INACTIVE)
 
-    @commands.command(name="join")
+    @commands.command(name="join", extras={"contest_channel_only": True})
     async def join(self, ctx) -> None:
         """Join the typing contest.
 
         This command allows a user to join the active typing contest if
-        they are not banned and if the contest is currently active.
+        they are not banned and if the contest is currently active. In the
+        channel of a tournament taking registrations, it registers the user
+        for the tournament instead.
 
         Args:
             ctx: The command context.
         """
-        if not await self.validate_contest_status(ctx):
+        tournament = self.registering_tournament(ctx)
+        if tournament is not None:
+            try:
+                tournament.register(ctx.author)
+            except ContestError as error:
+                await self.reply_error(ctx, error)
+                return
+            await ctx.reply(REGISTER_SUCCESS.format(user=ctx.author.mention))
             return
 
-        if ctx.author in self.banned_participants:
-            await ctx.reply(
-                BANNED_USER_TRY_JOIN.format(user=ctx.author.mention)
-            )
+        contest = await self.validate_contest_status(ctx)
+        if contest is None:
             return
 
-        if ctx.author in self.participants:
-            await ctx.reply(ALREADY_JOINED)
-        else:
-            self.participants.add(ctx.author)
-            self.wpm_results[ctx.author] = ["-"] * max(self.round - 1, 0)
-            await self.assign_participant_role(ctx.author)
-            print(self.participant_role)
-            await ctx.reply(JOIN_SUCCESS.format(user=ctx.author.mention))
+        if self.state.tournament is not None and self.state.tournament.holds(
+            contest
+        ):
+            # Heats and the final are filled from the registrations
+            await ctx.reply(REGISTRATION_CLOSED)
+            return
 
-        self.update_activity_time()
+        try:
+            await contest.submit(contest.join, ctx.author)
+        except ContestError as error:
+            await self.reply_error(ctx, error)
+            return
+
+        self.refresh_scoreboard(contest)
+
+        if self.state.participant_role is None:
+            await self.create_participant_role(ctx)
+        await self.assign_participant_role(ctx.author)
+        await ctx.reply(JOIN_SUCCESS.format(user=ctx.author.mention))
 
-    @commands.command(name="quit")
+    @commands.command(name="quit", extras={"contest_channel_only": True})
     async def quit(self, ctx) -> None:
         """Quit the typing contest.
 
         This command allow a user to leave the typing contest. The user
-        must be a participant in the contest to successfully quit.
+        must be a participant in the contest to successfully quit. In the
+        channel of a tournament taking registrations, it withdraws the user's
+        registration instead.
 
         Args:
             ctx: The command context.
         """
-        if not await self.validate_contest_status(ctx):
+        tournament = self.registering_tournament(ctx)
+        if tournament is not None:
+            try:
+                tournament.unregister(ctx.author)
+            except ContestError as error:
+                await self.reply_error(ctx, error)
+                return
+            await ctx.reply(UNREGISTER_SUCCESS.format(user=ctx.author.mention))
             return
 
-        if ctx.author not in self.participants:
-            await ctx.reply(NOT_IN_CONTEST)
-        else:
-            self.participants.remove(ctx.author)
-            self.wpm_results.pop(ctx.author)
-            await self.remove_participant_role(ctx.author)
-            await ctx.reply(QUIT_SUCCESS.format(user=ctx.author.mention))
+        contest = await self.validate_contest_status(ctx)
+        if contest is None:
+            return
 
-        self.update_activity_time()
+        try:
+            await contest.submit(contest.quit, ctx.author)
+        except ContestError as error:
+            await self.reply_error(ctx, error)
+            return
+
+        self.refresh_scoreboard(contest)
+
+        await self.remove_participant_role(ctx.author)
+        await ctx.reply(QUIT_SUCCESS.format(user=ctx.author.mention))
 
-    @commands.command(name="list")
+    @commands.command(name="list", extras={"contest_channel_only": True})
     async def list_participants(self, ctx) -> None:
         """List participants in the typing contest.
 
         This command displays the current participants in the typing contest.
-        If no participants are present, it notifies the user accordingly.
+        If no participants are present, it notifies the user accordingly. In
+        the channel of a tournament taking registrations, it lists the
+        registrants instead.
 
         Args:
             ctx: The command context.
         """
-        if not await self.validate_contest_status(ctx):
+        tournament = self.registering_tournament(ctx)
+        if tournament is not None:
+            # Registrations can run into the thousands, too many to mention
+            if not tournament.registrants:
+                await ctx.reply(NO_REGISTRANTS)
+            else:
+                await ctx.reply(
+                    REGISTRANT_COUNT.format(count=len(tournament.registrants))
+                )
+            return
+
+        contest = await self.validate_contest_status(ctx)
+        if contest is None:
             return
 
-        if not self.participants:
+        try:
+            participants = await contest.submit(contest.list_participants)
+        except ContestError as error:
+            await self.reply_error(ctx, error)
+            return
+
+        if not participants:
             await ctx.reply(NO_PARTICIPANTS)
             return
 
         participants_list = "\n".join(
-            [participant.mention for participant in self.participants]
+            [participant.mention for participant in participants]
         )
         embed = discord.Embed(
             title="Contest Participants",
@@ -481,9 +783,7 @@ class TypingContestBot(commands.Cog):
         )
         await ctx.reply(embed=embed)
 
-        self.update_activity_time()
-
-    @commands.command(name="next")
+    @commands.command(name="next", extras={"contest_channel_only": True})
     async def next(self, ctx) -> None:
         """Proceed to the next round of the typing contest.
 
@@ -493,88 +793,179 @@ class TypingContestBot(commands.Cog):
         Args:
             ctx: The command context.
         """
-        if not await self.validate_contest_status(ctx):
+        contest = await self.validate_contest_status(ctx)
+        if contest is None:
             return
 
-        if ctx.author != self.contest_creator:
+        if ctx.author != contest.creator:
             await ctx.reply(NOT_CONTEST_CREATOR)
             return
 
-        if self.last_next_used:
-            await ctx.reply(MUST_SUBMIT_WPM)
+        try:
+            wpm_result_rows, round_number = await contest.submit(
+                contest.advance_round
+            )
+        except ContestError as error:
+            await self.reply_error(ctx, error)
             return
 
-        for participant in self.participants:
-            if len(self.wpm_results[participant]) != self.round:
-                self.wpm_results[participant].append("-")
-
-        await ctx.send(
-            f"## WPM result table\n\n```{self.get_wpm_result_table()}```",
-        )
-        self.round += 1
-        if self.participant_role is None:
+        if contest.channel.id in self.state.scoreboards:
+            # The live scoreboard already shows the table
+            self.refresh_scoreboard(contest)
+        else:
+            content, file = await self.format_results(
+                wpm_result_rows, contest.channel.id in self.state.image_channels
+            )
+            await ctx.send(content, file=file)
+        if self.state.participant_role is None:
             await self.create_participant_role(ctx)
         await ctx.send(
-            f"{self.participant_role.mention} Get ready! Round {self.round} is starting!"
+            f"{self.state.participant_role.mention} Get ready! Round {round_number} is starting!"
         )
 
-        self.last_next_used = True
-        self.update_activity_time()
-
-    @commands.command(name="wpm")
+    @commands.command(name="wpm", extras={"contest_channel_only": True})
     async def wpm(self, ctx, wpm: str) -> None:
         """Submit WPM result for the current round.
 
         This command allows a participant to submit their WPM result for the
         current round. The result must be a positive integer. If the submission
         is valid, the bot will react to the user's message with a checkmark
-        emoji.
+        emoji. A WPM that looks unusual is held back until the contest creator
+        confirms it.
 
         Args:
             ctx: The command context.
             wpm: The WPM result submitted by the participant.
         """
-        if not await self.validate_contest_status(ctx):
+        contest = await self.validate_contest_status(ctx)
+        if contest is None:
             return
 
-        if ctx.author not in self.participants:
-            await ctx.reply(NOT_IN_CONTEST)
+        try:
+            flagged = await contest.submit(contest.submit_wpm, ctx.author, wpm)
+        except ContestError as error:
+            await self.reply_error(ctx, error)
             return
 
-        if self.round == 0:
-            await ctx.reply(ROUND_NOT_STARTED)
-            return
+        self.refresh_scoreboard(contest)
 
-        if not wpm.isdigit() or int(wpm) <= 0:
-            await ctx.reply(INVALID_WPM)
+        if flagged:
+            await ctx.reply(
+                WPM_FLAGGED.format(
+                    user=ctx.author.mention,
+                    wpm=wpm,
+                    creator=contest.creator.mention,
+                )
+            )
             return
 
-        if len(self.wpm_results[ctx.author]) != self.round:
-            self.wpm_results[ctx.author].append(wpm)
-        self.wpm_results[ctx.author][-1] = wpm
         await ctx.message.add_reaction(CHECKMARK_EMOJI)
 
-        self.last_next_used = False
-        self.update_activity_time()
-
-    @commands.command(name="result")
+    @commands.command(name="result", extras={"contest_channel_only": True})
     async def result(self, ctx) -> None:
         """View the WPM results table.
 
         This command displays the WPM results table for the current contest.
-        It can be called at any time while the contest is active.
+        It can be called at any time while the contest is active. If the
+        contest has a live scoreboard, it points to it instead.
 
         Args:
             ctx: The command context.
         """
-        if not await self.validate_contest_status(ctx):
+        contest = await self.validate_contest_status(ctx)
+        if contest is None:
             return
 
-        await ctx.reply(
-            f"## WPM result table\n\n```{self.get_wpm_result_table()}```"
+        scoreboard = self.state.scoreboards.get(contest.channel.id)
+        if scoreboard is not None:
+            await ctx.reply(
+                SCOREBOARD_LINK.format(url=scoreboard.message.jump_url)
+            )
+            return
+
+        try:
+            wpm_result_rows = await contest.submit(contest.get_wpm_result_rows)
+        except ContestError as error:
+            await self.reply_error(ctx, error)
+            return
+
+        content, file = await self.format_results(
+            wpm_result_rows, contest.channel.id in self.state.image_channels
         )
+        await ctx.reply(content, file=file)
+
+    @commands.command(name="scoreboard", extras={"contest_channel_only": True})
+    async def scoreboard(self, ctx) -> None:
+        """Post a live scoreboard for the typing contest.
 
-    @commands.command(name="remind")
+        The scoreboard is a single pinned message that is edited in place as
+        the results change, instead of a new table for every `!next` and
+        `!result`. Only the contest creator can use this command.
+
+        Args:
+            ctx: The command context.
+        """
+        contest = await self.validate_contest_status(ctx)
+        if contest is None:
+            return
+
+        if ctx.author != contest.creator:
+            await ctx.reply(NOT_CONTEST_CREATOR)
+            return
+
+        scoreboard = self.state.scoreboards.get(contest.channel.id)
+        if scoreboard is not None:
+            await ctx.reply(
+                SCOREBOARD_LINK.format(url=scoreboard.message.jump_url)
+            )
+            return
+
+        content = await self.render_scoreboard(contest)
+        if content is None:
+            return
+
+        message = await ctx.send(content)
+        if not contest.active or contest.channel.id in self.state.scoreboards:
+            # The contest ended or another scoreboard was posted meanwhile
+            return
+
+        scoreboard = LiveScoreboard(
+            message, functools.partial(self.render_scoreboard, contest)
+        )
+        self.state.scoreboards[contest.channel.id] = scoreboard
+        await scoreboard.pin()
+
+    @commands.command(name="images", extras={"contest_channel_only": True})
+    async def images(self, ctx) -> None:
+        """Toggle posting result tables as images.
+
+        When enabled, `!next`, `!result` and `!end` post the WPM result table
+        as a PNG, which stays readable on mobile, and `!end` adds a podium of
+        the top participants. Only the contest creator can use this command.
+
+        Args:
+            ctx: The command context.
+        """
+        contest = await self.validate_contest_status(ctx)
+        if contest is None:
+            return
+
+        if ctx.author != contest.creator:
+            await ctx.reply(NOT_CONTEST_CREATOR)
+            return
+
+        if not images_available():
+            await ctx.reply(IMAGES_UNAVAILABLE)
+            return
+
+        if contest.channel.id in self.state.image_channels:
+            self.state.image_channels.discard(contest.channel.id)
+            await ctx.reply(IMAGES_DISABLED)
+        else:
+            self.state.image_channels.add(contest.channel.id)
+            await ctx.reply(IMAGES_ENABLED)
+
+    @commands.command(name="remind", extras={"contest_channel_only": True})
     async def remind(self, ctx) -> None:
         """Send reminders to participants.
 
@@ -585,94 +976,450 @@ class TypingContestBot(commands.Cog):
         Args:
             ctx: The command context.
         """
-        if not await self.validate_contest_status(ctx):
+        contest = await self.validate_contest_status(ctx)
+        if contest is None:
             return
 
-        pending_participants = [
-            participant.mention
-            for participant in self.participants
-            if len(self.wpm_results[participant]) < self.round
-        ]
+        try:
+            pending_participants = await contest.submit(
+                contest.pending_participants
+            )
+        except ContestError as error:
+            await self.reply_error(ctx, error)
+            return
 
         if pending_participants:
             reminder_message = REMINDER_SUCCESS.format(
-                pending_participants="\n".join(pending_participants)
+                pending_participants="\n".join(
+                    participant.mention for participant in pending_participants
+                )
             )
         else:
             reminder_message = ALL_SUBMITTED_SUCCESS
 
         await ctx.send(reminder_message)
 
-        self.update_activity_time()
-
-    @commands.command(name="remove")
-    async def remove(self, ctx, member: discord.Member) -> None:
+    @commands.command(name="remove", extras={"contest_channel_only": True})
+    async def remove(self, ctx, member: ContestMember) -> None:
         """Remove a participant form the typing contest.
 
         This command allows the contest creator to remove a participant from
         the contest. The participant must be present in the contest to be
-        removed.
+        removed, and can be given by mention, ID, name or a name prefix.
 
         Args:
             ctx: The command context.
             member: The participant to be removed.
         """
-        if not await self.validate_contest_status(ctx):
+        contest = await self.validate_contest_status(ctx)
+        if contest is None:
             return
 
-        if ctx.author != self.contest_creator:
+        if ctx.author != contest.creator:
             await ctx.reply(NOT_CONTEST_CREATOR)
             return
 
-        if member not in ctx.guild.members:
+        if ctx.guild.get_member(member.id) is None:
             await ctx.reply(MEMBER_NOT_IN_GUILD.format(member=member))
             return
 
-        if member not in self.participants:
-            await ctx.reply(MEMBER_NOT_IN_CONTEST.format(member=member))
+        try:
+            await contest.submit(contest.remove, member)
+        except ContestError as error:
+            await self.reply_error(ctx, error)
             return
 
-        self.participants.remove(member)
-        self.wpm_results.pop(member, None)
+        self.refresh_scoreboard(contest)
+
         await self.remove_participant_role(member)
         await ctx.reply(REMOVE_SUCCESS.format(member=member.mention))
 
-        self.update_activity_time()
-
-    @commands.command(name="ban")
-    async def ban(self, ctx, member: discord.Member) -> None:
+    @commands.command(name="ban", extras={"contest_channel_only": True})
+    async def ban(self, ctx, member: ContestMember) -> None:
         """Ban a participant from the typing contest.
 
         This command allows the contest creator to ban a participant, preventing
         them from rejoining the contest. The participant must be present in the
-        contest to be banned.
+        contest to be banned, and can be given by mention, ID, name or a name
+        prefix.
 
         Args:
             ctx: The command context.
             member: The participant to be banned.
         """
-        if not await self.validate_contest_status(ctx):
+        contest = await self.validate_contest_status(ctx)
+        if contest is None:
             return
 
-        if ctx.author != self.contest_creator:
+        if ctx.author != contest.creator:
             await ctx.reply(NOT_CONTEST_CREATOR)
             return
 
-        if member not in ctx.guild.members:
+        if ctx.guild.get_member(member.id) is None:
             await ctx.reply(MEMBER_NOT_IN_GUILD.format(member=member))
             return
 
-        if member not in self.participants:
-            await ctx.reply(MEMBER_NOT_IN_CONTEST.format(member=member))
+        try:
+            await contest.submit(contest.ban, member)
+        except ContestError as error:
+            await self.reply_error(ctx, error)
             return
 
-        self.participants.remove(member)
-        self.wpm_results.pop(member, None)
-        self.banned_participants.add(member)
+        self.refresh_scoreboard(contest)
+
         await self.remove_participant_role(member)
         await ctx.reply(BAN_SUCCESS.format(user=member.mention))
 
-        self.update_activity_time()
+    @commands.command(name="confirm", extras={"contest_channel_only": True})
+    async def confirm(self, ctx, member: ContestMember) -> None:
+        """Confirm a participant's flagged WPM results.
+
+        Only the contest creator can use this command.
+
+        Args:
+            ctx: The command context.
+            member: The participant whose flagged WPMs are confirmed.
+        """
+        contest = await self.validate_contest_status(ctx)
+        if contest is None:
+            return
+
+        if ctx.author != contest.creator:
+            await ctx.reply(NOT_CONTEST_CREATOR)
+            return
+
+        try:
+            wpms = await contest.submit(contest.confirm_wpm, member)
+        except ContestError as error:
+            await self.reply_error(ctx, error)
+            return
+
+        self.refresh_scoreboard(contest)
+
+        await ctx.reply(
+            CONFIRM_SUCCESS.format(member=member.mention, wpms=", ".join(wpms))
+        )
+
+    @commands.command(name="hold", extras={"contest_channel_only": True})
+    async def hold(self, ctx, member: ContestMember) -> None:
+        """Hold back a participant's flagged WPM results.
+
+        Held results count as missing. Only the contest creator can use this
+        command.
+
+        Args:
+            ctx: The command context.
+            member: The participant whose flagged WPMs are held back.
+        """
+        contest = await self.validate_contest_status(ctx)
+        if contest is None:
+            return
+
+        if ctx.author != contest.creator:
+            await ctx.reply(NOT_CONTEST_CREATOR)
+            return
+
+        try:
+            wpms = await contest.submit(contest.hold_wpm, member)
+        except ContestError as error:
+            await self.reply_error(ctx, error)
+            return
+
+        self.refresh_scoreboard(contest)
+
+        await ctx.reply(
+            HOLD_SUCCESS.format(member=member.mention, wpms=", ".join(wpms))
+        )
+
+    @commands.command(name="rating")
+    async def rating(self, ctx, member: discord.Member | None = None) -> None:
+        """Show a typist's skill rating.
+
+        Ratings carry over from contest to contest and are updated every time
+        a contest ends.
+
+        Args:
+            ctx: The command context.
+            member: The typist to show. Defaults to the user.
+        """
+        member = member or ctx.author
+        ratings = self.state.ratings
+        if member.id not in ratings.ratings:
+            await ctx.reply(NOT_RATED.format(member=member.mention))
+            return
+
+        await ctx.reply(
+            RATING_INFO.format(
+                member=member.mention,
+                rating=ratings.rating(member.id),
+                contests=ratings.contests[member.id],
+                rank=ratings.rank(member.id),
+                total=len(ratings.ratings),
+            )
+        )
+
+    @commands.group(name="tournament", invoke_without_command=True)
+    async def tournament_command(self, ctx) -> None:
+        """Show how to run a typing tournament.
+
+        Args:
+            ctx: The command context.
+        """
+        await ctx.reply(TOURNAMENT_USAGE)
+
+    @tournament_command.command(name="start")
+    async def tournament_start(
+        self, ctx, heat_channels: commands.Greedy[discord.TextChannel]
+    ) -> None:
+        """Start a typing tournament and open registration.
+
+        Registration takes place in the current channel, where the final is
+        also played. The heats are played in the mentioned channels.
+
+        Args:
+            ctx: The command context.
+            heat_channels: The channels to play the heats in.
+        """
+        if self.state.tournament is not None:
+            await ctx.reply(TOURNAMENT_ALREADY_ACTIVE)
+            return
+
+        if self.is_active():
+            await ctx.reply(CONTEST_ALREADY_ACTIVE)
+            return
+
+        heat_channels = [
+            channel
+            for channel in dict.fromkeys(heat_channels)
+            if channel != ctx.channel
+        ]
+        if not heat_channels:
+            await ctx.reply(TOURNAMENT_NO_HEAT_CHANNELS)
+            return
+
+        self.state.tournament = Tournament(
+            ctx.author, ctx.channel, heat_channels, self.state.typist_stats
+        )
+        self.bot.dispatch_filter.add_contest_channel(ctx.channel.id)
+
+        if self.state.participant_role is None:
+            await self.create_participant_role(ctx)
+
+        typist_role = await self.get_typist_role(ctx)
+        await ctx.reply(
+            TOURNAMENT_START_SUCCESS.format(
+                typist_role=typist_role.mention,
+                heat_channels=", ".join(
+                    channel.mention for channel in heat_channels
+                ),
+            )
+        )
+
+    @tournament_command.command(name="heats")
+    async def tournament_heats(self, ctx) -> None:
+        """Close registration and start the heats.
+
+        The heats are seeded by skill rating, so the strongest typists are
+        spread over the heats. Only the tournament creator can use this
+        command.
+
+        Args:
+            ctx: The command context.
+        """
+        tournament = self.state.tournament
+        if tournament is None:
+            await ctx.reply(NO_ACTIVE_TOURNAMENT)
+            return
+
+        if ctx.author != tournament.creator:
+            await ctx.reply(NOT_CONTEST_CREATOR)
+            return
+
+        if tournament.stage != STAGE_REGISTRATION:
+            await ctx.reply(
+                TOURNAMENT_WRONG_STAGE.format(stage=tournament.stage)
+            )
+            return
+
+        registrants = sorted(
+            tournament.registrants,
+            key=lambda member: self.state.ratings.rating(member.id),
+            reverse=True,
+        )
+        try:
+            heats = tournament.split_into_heats(registrants)
+        except ContestError as error:
+            await self.reply_error(ctx, error)
+            return
+
+        for heat in heats:
+            self.open_contest(heat)
+
+        await ctx.reply(
+            HEATS_START_SUCCESS.format(
+                heat_channels=", ".join(heat.channel.mention for heat in heats)
+            )
+        )
+        for number, heat in enumerate(heats, start=1):
+            await heat.channel.send(
+                HEAT_START_SUCCESS.format(
+                    heat=number, typists=len(heat.participants)
+                )
+            )
+        for member in tournament.registrants:
+            await self.assign_participant_role(member)
+
+    @tournament_command.command(name="cancel")
+    async def tournament_cancel(self, ctx) -> None:
+        """Cancel a tournament that has not left its registration stage.
+
+        Only the tournament creator can use this command.
+
+        Args:
+            ctx: The command context.
+        """
+        tournament = self.state.tournament
+        if tournament is None:
+            await ctx.reply(NO_ACTIVE_TOURNAMENT)
+            return
+
+        if ctx.author != tournament.creator:
+            await ctx.reply(NOT_CONTEST_CREATOR)
+            return
+
+        if tournament.stage != STAGE_REGISTRATION:
+            await ctx.reply(
+                TOURNAMENT_WRONG_STAGE.format(stage=tournament.stage)
+            )
+            return
+
+        self.state.tournament = None
+        self.bot.dispatch_filter.remove_contest_channel(tournament.channel.id)
+        await ctx.reply(TOURNAMENT_CANCEL_SUCCESS)
+
+    @tournament_command.command(name="heat")
+    async def tournament_heat(self, ctx) -> None:
+        """Tell the user which heat they are playing in.
+
+        Args:
+            ctx: The command context.
+        """
+        tournament = self.state.tournament
+        if tournament is None:
+            await ctx.reply(NO_ACTIVE_TOURNAMENT)
+            return
+
+        for heat in tournament.heats.values():
+            if ctx.author in heat.participants:
+                await ctx.reply(
+                    YOUR_HEAT.format(heat_channel=heat.channel.mention)
+                )
+                return
+        await ctx.reply(NOT_IN_ANY_HEAT)
+
+    @tournament_command.command(name="final")
+    async def tournament_final(
+        self, ctx, per_heat: int = TOURNAMENT_QUALIFIERS_PER_HEAT
+    ) -> None:
+        """Start the final with the best typists of every heat.
+
+        Only the tournament creator can use this command, once every heat has
+        ended.
+
+        Args:
+            ctx: The command context.
+            per_heat: How many typists qualify from each heat.
+        """
+        tournament = self.state.tournament
+        if tournament is None:
+            await ctx.reply(NO_ACTIVE_TOURNAMENT)
+            return
+
+        if ctx.author != tournament.creator:
+            await ctx.reply(NOT_CONTEST_CREATOR)
+            return
+
+        if tournament.stage != STAGE_HEATS:
+            await ctx.reply(
+                TOURNAMENT_WRONG_STAGE.format(stage=tournament.stage)
+            )
+            return
+
+        if len(tournament.heat_averages) != len(tournament.heats):
+            await ctx.reply(
+                HEATS_NOT_FINISHED.format(
+                    finished=len(tournament.heat_averages),
+                    total=len(tournament.heats),
+                )
+            )
+            return
+
+        per_heat = max(per_heat, 1)
+        if not tournament.qualifiers(per_heat):
+            # Checked before creating the final, whose worker would never
+            # be stopped otherwise
+            self.state.tournament = None
+            self.bot.dispatch_filter.remove_contest_channel(
+                tournament.channel.id
+            )
+            await ctx.reply(NO_QUALIFIERS)
+            await ctx.send(self.format_leaderboard(tournament))
+            return
+
+        final = tournament.start_final(per_heat)
+        self.open_contest(final)
+        # Ending the heats took the participant role away from the finalists.
+        # Role changes are serialized per member and a heat still removing
+        # roles skips the finalists, so it cannot undo this
+        for member in final.participants:
+            await self.assign_participant_role(member)
+        typist_role = await self.get_typist_role(ctx)
+        await ctx.send(
+            FINAL_START_SUCCESS.format(
+                typist_role=typist_role.mention,
+                typists=", ".join(
+                    member.mention for member in final.participants
+                ),
+            )
+        )
+
+    @tournament_command.command(name="standings")
+    async def tournament_standings(self, ctx) -> None:
+        """Show the overall leaderboard of the heats finished so far.
+
+        Args:
+            ctx: The command context.
+        """
+        if self.state.tournament is None:
+            await ctx.reply(NO_ACTIVE_TOURNAMENT)
+            return
+
+        await ctx.reply(self.format_leaderboard(self.state.tournament))
+
+    @commands.command(name="reload")
+    async def reload(self, ctx) -> None:
+        """Hot reload this cog from its source.
+
+        The contests carry on in the new version of the cog, and commands
+        sent during the reload are held back until it is done rather than
+        lost. Only the bot owner can use this command.
+
+        Args:
+            ctx: The command context.
+        """
+        if not await self.bot.is_owner(ctx.author):
+            await ctx.reply(NOT_BOT_OWNER)
+            return
+
+        started_at = time.perf_counter()
+        try:
+            await self.bot.reload_extension(__name__)
+        except commands.ExtensionError as error:
+            await ctx.reply(RELOAD_FAILED.format(error=error))
+            return
+
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+        await ctx.reply(RELOAD_SUCCESS.format(elapsed_ms=elapsed_ms))
 
     @commands.command(name="getrole")
     async def get_role(self, ctx) -> None:
@@ -752,6 +1499,16 @@ class TypingContestBot(commands.Cog):
             value="View the WPM results table at any time, not just after advancing rounds.",
             inline=False,
         )
+        embed.add_field(
+            name="!scoreboard",
+            value="Post a live scoreboard that is updated in place as results come in. `!result` then points to it. Only the contest creator can use this.",
+            inline=False,
+        )
+        embed.add_field(
+            name="!images",
+            value="Toggle posting the WPM result tables as images, with a podium at the end of the contest. Only the contest creator can use this.",
+            inline=False,
+        )
         embed.add_field(
             name="!remind",
             value="Sends a reminder to participants who haven't submitted their WPM for the current round. Use this if the round has ended and some participants have not yet submitted their results.",
@@ -767,6 +1524,26 @@ class TypingContestBot(commands.Cog):
             value="Ban a participant from the typing contest. Once banned, they cannot join again. Only the contest creator can use this.",
             inline=False,
         )
+        embed.add_field(
+            name="!confirm {member}",
+            value="Confirm a participant's WPM that was flagged as unusual. Only the contest creator can use this.",
+            inline=False,
+        )
+        embed.add_field(
+            name="!hold {member}",
+            value="Hold back a participant's WPM that was flagged as unusual, so it counts as missing. Only the contest creator can use this.",
+            inline=False,
+        )
+        embed.add_field(
+            name="!rating [member]",
+            value="Show your skill rating, or another typist's. Ratings are updated at the end of every contest.",
+            inline=False,
+        )
+        embed.add_field(
+            name="!tournament",
+            value="Run a tournament whose heats are played in parallel channels. Use `!tournament` for details.",
+            inline=False,
+        )
         embed.add_field(
             name="!getrole",
             value="Assign yourself the typist role.",
@@ -776,3 +1553,12 @@ class TypingContestBot(commands.Cog):
             name="!commands", value="Show this list of commands.", inline=False
         )
         await ctx.reply(embed=embed)
+
+
+async def setup(bot: commands.Bot) -> None:
+    """Add the cog to the bot, taking over the bot's contest state.
+
+    Args:
+        bot: The bot instance, with its `contest_state` already set.
+    """
+    await bot.add_cog(TypingContestBot(bot, bot.contest_state))
@@ -19,6 +19,7 @@ MEMBER_NOT_IN_GUILD = (
     "{member} is no longer in the server or is not a valid member."
 )
 MEMBER_NOT_IN_CONTEST = "{member} is not in the contest."
+AMBIGUOUS_MEMBER = '"{argument}" matches several typists: {members}. Please mention the one you mean.'
 REMOVE_SUCCESS = "{member} has been removed from the contest."
 BAN_SUCCESS = "{user} has been banned from the contest."
 BANNED_USER_TRY_JOIN = "{user}, you are banned from joining the contest."
@@ -31,16 +32,129 @@ ALL_SUBMITTED_SUCCESS = (
     "All participants have submitted their WPM for this round."
 )
 MUST_SUBMIT_WPM = "At least one participant must submit a WPM before advancing to the next round."
+WPM_FLAGGED = "{user}, your WPM of {wpm} looks unusual and is held back from the results until {creator} checks it with `!confirm` or `!hold`."
+NO_FLAGGED_WPM = "{member} has no flagged WPM."
+CONFIRM_SUCCESS = "Confirmed {member}'s WPM: {wpms}."
+HOLD_SUCCESS = (
+    "Held back {member}'s WPM: {wpms}. Held results count as missing."
+)
+SCOREBOARD_LINK = "The results are on the live scoreboard: {url}"
+IMAGES_ENABLED = "Result tables will be posted as images."
+IMAGES_DISABLED = "Result tables will be posted as text."
+IMAGES_UNAVAILABLE = "Result images are not available, Pillow is not installed."
+
+# Tournament Messages
+TOURNAMENT_START_SUCCESS = "{typist_role} A typing tournament has started! Register using `!join` in this channel. Heats will be played in {heat_channels}."
+TOURNAMENT_ALREADY_ACTIVE = "A typing tournament is already running!"
+NO_ACTIVE_TOURNAMENT = "No typing tournament is currently running."
+TOURNAMENT_NO_HEAT_CHANNELS = "Please mention at least one channel to play the heats in, e.g. `!tournament start #heat-1 #heat-2`."
+REGISTER_SUCCESS = "{user} has registered for the tournament!"
+UNREGISTER_SUCCESS = "{user} has withdrawn from the tournament!"
+ALREADY_REGISTERED = "You are already registered for the tournament."
+NOT_REGISTERED = "You are not registered for the tournament."
+NO_REGISTRANTS = "No one has registered for the tournament yet."
+REGISTRANT_COUNT = "{count} typists have registered for the tournament."
+TOURNAMENT_NOT_ENOUGH_REGISTRANTS = (
+    "At least {heats} registrants are needed to fill every heat."
+)
+TOURNAMENT_WRONG_STAGE = "This can't be done during the {stage} stage."
+HEAT_START_SUCCESS = "Heat {heat} of the tournament is starting with {typists} typists! The creator will start each round with `!next`."
+HEATS_START_SUCCESS = "The heats have started in {heat_channels}! Use `!tournament heat` to find yours."
+YOUR_HEAT = "You are playing in {heat_channel}."
+NOT_IN_ANY_HEAT = "You are not playing in any heat."
+REGISTRATION_CLOSED = "Registration for the tournament is closed."
+HEATS_NOT_FINISHED = (
+    "Every heat must end before the final can start ({finished}/{total} ended)."
+)
+ALL_HEATS_FINISHED = (
+    "{creator} Every heat has ended! Start the final with `!tournament final`."
+)
+FINAL_START_SUCCESS = "{typist_role} The final is starting! Finalists: {typists}\nThe creator will start each round with `!next`."
+NO_QUALIFIERS = "No typist qualified from the heats."
+TOURNAMENT_END_SUCCESS = "The tournament is over! Thank you all for typing."
+TOURNAMENT_CANCEL_SUCCESS = "The tournament has been cancelled."
+TOURNAMENT_USAGE = (
+    "How to run a tournament:\n"
+    "1. `!tournament start #heat-1 #heat-2 ...` opens registration here; typists register with `!join`.\n"
+    "2. `!tournament heats` splits the registrants into one heat per channel. Play each heat with `!next`, `!wpm` and `!end`.\n"
+    "3. `!tournament final [qualifiers per heat]` starts the final here with the best typists of every heat. `!end` it to see the overall leaderboard.\n"
+    "Use `!tournament heat` to find your heat and `!tournament standings` to see the leaderboard so far. "
+    "The creator can `!tournament cancel` before the heats start."
+)
+
+# Rating Messages
+RATING_INFO = "{member} has a rating of {rating:.0f} after {contests} rated contests, ranked {rank} of {total}."
+NOT_RATED = "{member} has no rating yet. Typists are rated when a contest ends with at least two qualified typists."
+
+# Admission Control Messages
+USER_THROTTLED = "{user}, you are sending commands too fast. Please wait a moment; commands sent in the meantime are ignored."
+CHANNEL_THROTTLED = "This channel is receiving too many commands, so some were ignored. Please resend yours in a moment."
+
+# Bot Administration Messages
+NOT_BOT_OWNER = "Only the bot owner can use this command."
+RELOAD_SUCCESS = "Reloaded the contest commands in {elapsed_ms:.0f} ms."
+RELOAD_FAILED = "Reload failed, the previous version is still running: {error}"
 
 # Ranking and Emojis
 RANKING_EMOJIS = [":first_place:", ":second_place:", ":third_place:"]
 CHECKMARK_EMOJI = "\u2705"  # \u2705 is equivalent to :white_check_mark: emoji
 
+# Matches listed when a member argument is ambiguous
+AMBIGUOUS_MEMBER_SHOWN = 5
+
+# Tournaments
+TOURNAMENT_QUALIFIERS_PER_HEAT = 3
+TOURNAMENT_LEADERBOARD_SIZE = 20
+
+# Minimum seconds between two edits of a live scoreboard
+SCOREBOARD_EDIT_INTERVAL_SECONDS = 5
+
+# WPM anomaly detection
+FLAGGED_WPM_SUFFIX = "?"  # Marks a flagged WPM in the results
+SUSPICIOUS_WPM_ABOVE = 250  # Always flagged, well above human typing speeds
+ANOMALY_Z_SCORE = 3.0
+ANOMALY_MIN_STD_WPM = 10.0  # Floor for the standard deviation in z-scores
+ANOMALY_MIN_USER_SAMPLES = 2  # Accepted WPMs needed to flag a typist
+ANOMALY_MIN_ROUND_SAMPLES = 5  # Submissions needed to check against a round
+
+# Skill ratings, updated with a multi-player Elo at the end of every contest
+RATING_INITIAL = 1500
+RATING_K_FACTOR = 32
+RATING_PROVISIONAL_K_FACTOR = 64  # Lets new typists reach their level fast
+RATING_PROVISIONAL_CONTESTS = 5  # Rated contests played with the higher K
+
+# Result images
+RESULT_IMAGE_FONT = "DejaVuSansMono{style}.ttf"  # {style} is "" or "-Bold"
+RESULT_IMAGE_WORKERS = 2
+RESULT_IMAGE_CACHE_SIZE = 128
+RESULT_IMAGE_FILENAME = "results.png"
+
+# Command admission control: tokens per second and burst size of the token
+# buckets per user, channel and guild. The channel and guild buckets are sized
+# so every typist of a 1000-typist contest can send a command at once, and
+# only stop floods beyond that. Contest creators are never throttled
+USER_COMMAND_RATE = 0.5
+USER_COMMAND_BURST = 5
+CHANNEL_COMMAND_RATE = 200
+CHANNEL_COMMAND_BURST = 2000
+GUILD_COMMAND_RATE = 400
+GUILD_COMMAND_BURST = 4000
+# Seconds during which a throttled user or channel gets no further replies
+ADMISSION_REPLY_COOLDOWN_SECONDS = 10
+ADMISSION_PRUNE_INTERVAL_SECONDS = 60
+
 # Idle threshold minutes
 IDLE_THRESHOLD_MINUTES = 10
 
+# Seconds during which contest commands sent while no contest is active are
+# dropped instead of each getting its own NO_ACTIVE_CONTEST reply
+NO_ACTIVE_CONTEST_REPLY_COOLDOWN_SECONDS = 30
+
 # Roles
 PARTICIPANT_ROLE_NAME = "Participant"
 
 # File Paths
 CONFIG_JSON_FILE_PATH = "./config/config.json"
+# Kept next to the config file
+RATINGS_JSON_FILE_NAME = "ratings.json"
+RATING_HISTORY_FILE_NAME = "rating_history.jsonl"
@@ -0,0 +1,580 @@
+import asyncio
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+import discord
+
+from constants import (
+    ALREADY_JOINED,
+    ANOMALY_MIN_ROUND_SAMPLES,
+    ANOMALY_MIN_STD_WPM,
+    ANOMALY_MIN_USER_SAMPLES,
+    ANOMALY_Z_SCORE,
+    BANNED_USER_TRY_JOIN,
+    FLAGGED_WPM_SUFFIX,
+    INVALID_WPM,
+    MEMBER_NOT_IN_CONTEST,
+    MUST_SUBMIT_WPM,
+    NO_ACTIVE_CONTEST,
+    NO_FLAGGED_WPM,
+    NOT_IN_CONTEST,
+    ROUND_NOT_STARTED,
+    SUSPICIOUS_WPM_ABOVE,
+)
+from utils.member_index import MemberIndex
+from utils.running_stats import RunningStats
+
+
+def format_wpm_result_table(wpm_result_rows: list[list[str]]) -> str:
+    """Format WPM result rows as a monospace table.
+
+    Args:
+        wpm_result_rows: The header row followed by one row per participant.
+
+    Returns:
+        str: The formatted WPM result table.
+    """
+    # Transpose table for formatting
+    transposed_table = list(zip(*wpm_result_rows))
+    max_column_lengths = [
+        max(len(item) for item in column) for column in transposed_table
+    ]
+
+    # Insert row of dashes after headers
+    wpm_result_rows = list(wpm_result_rows)
+    wpm_result_rows.insert(1, ["-" * len for len in max_column_lengths])
+
+    # Format each row
+    formatted_rows = [
+        "| "
+        + " | ".join(
+            item.ljust(max_column_lengths[i])
+            if i == 0
+            else item.rjust(max_column_lengths[i])
+            for i, item in enumerate(row)
+        )
+        + " |"
+        for row in wpm_result_rows
+    ]
+
+    return "\n".join(formatted_rows)
+
+
+class ContestError(Exception):
+    """Raised by a contest transition that rejects a command.
+
+    Attributes:
+        reply: The message to reply to the command with.
+    """
+
+    def __init__(self, reply: str) -> None:
+        """Initialize the error.
+
+        Args:
+            reply: The message to reply to the command with.
+        """
+        super().__init__(reply)
+        self.reply: str = reply
+
+
+class Contest:
+    """The state of a single typing contest, run as a single-writer actor.
+
+    Commands never change the state directly. They submit a transition, a
+    plain synchronous method of this class, to the contest's queue and await
+    its result. One worker task drains the queue and applies every queued
+    transition in order in a single step, without yielding to the event loop
+    in between, so `!wpm`s queued before a `!next` always land in the round
+    they were sent for. Commands do their Discord I/O only once their
+    transition has been committed.
+
+    Checks that only depend on the creator, which never changes during a
+    contest, are left to the caller.
+
+    Attributes:
+        creator: The user who started the contest.
+        channel: The channel where the contest is being held.
+        active: False once the contest has ended.
+        participants: The set of participants in the contest.
+        banned_participants: The set of banned participants.
+        member_index: Resolves member arguments to participants and banned
+            participants.
+        round: The current round number.
+        last_next_used: Indicates whether the `!next` command was used in the last round.
+        wpm_results: WPM results for each participant.
+        top_three_participants: The top three participant based on average WPM.
+        participant_averages: The average WPM of every qualified participant,
+            as of the last result table.
+        typist_stats: Running statistics of every typist's accepted WPMs by
+            ID, shared with the other contests so a typist's history carries
+            over from one contest to the next.
+        round_stats: Running statistics of the accepted WPMs of each round.
+        last_activity_time: The last time an activity was recorded during the contest.
+        queue: The transitions waiting to be applied, with their futures.
+        worker: The task applying the queued transitions.
+    """
+
+    def __init__(
+        self,
+        creator: discord.Member,
+        channel: discord.TextChannel,
+        typist_stats: dict[int, RunningStats] | None = None,
+    ) -> None:
+        """Initialize the contest and start its worker.
+
+        Args:
+            creator: The user who started the contest.
+            channel: The channel where the contest is being held.
+            typist_stats: The running statistics of every typist's accepted
+                WPMs by ID, kept across contests. Defaults to a history of
+                this contest only.
+        """
+        self.creator: discord.Member = creator
+        self.channel: discord.TextChannel = channel
+        self.active: bool = True
+        self.participants: set[discord.Member] = set()
+        self.banned_participants: set[discord.Member] = set()
+        self.member_index: MemberIndex = MemberIndex()
+        self.round: int = 0
+        self.last_next_used: bool = False
+        self.wpm_results: dict[discord.Member, list[str]] = {}
+        self.top_three_participants: list[tuple[discord.Member, float]] = []
+        self.participant_averages: dict[discord.Member, float] = {}
+        self.typist_stats: dict[int, RunningStats] = (
+            typist_stats if typist_stats is not None else {}
+        )
+        self.round_stats: dict[int, RunningStats] = {}
+        self.last_activity_time: datetime = datetime.now()
+        self.queue: asyncio.Queue[
+            tuple[Callable[..., Any], tuple, asyncio.Future]
+        ] = asyncio.Queue()
+        self.worker: asyncio.Task = asyncio.create_task(self.process_queue())
+
+    async def submit(self, transition: Callable[..., Any], *args: Any) -> Any:
+        """Queue a transition and wait until it has been applied.
+
+        Args:
+            transition: A transition method of this contest.
+            *args: The arguments to apply the transition with.
+
+        Returns:
+            Any: The value returned by the transition.
+
+        Raises:
+            ContestError: If the transition rejected the command or the
+                contest has ended.
+        """
+        if not self.active:
+            raise ContestError(NO_ACTIVE_CONTEST)
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((transition, args, future))
+        return await future
+
+    async def process_queue(self) -> None:
+        """Apply queued transitions in batches until the contest ends."""
+        while self.active or not self.queue.empty():
+            batch = [await self.queue.get()]
+            while not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            for transition, args, future in batch:
+                if future.cancelled():
+                    continue
+                if not self.active:
+                    future.set_exception(ContestError(NO_ACTIVE_CONTEST))
+                    continue
+                try:
+                    future.set_result(transition(*args))
+                except Exception as error:
+                    future.set_exception(error)
+
+            self.last_activity_time = datetime.now()
+
+    def pad_missing_results(self) -> None:
+        """Append "-" for participants without a result in the current round."""
+        for participant in self.participants:
+            if len(self.wpm_results[participant]) != self.round:
+                self.wpm_results[participant].append("-")
+
+    def join(self, member: discord.Member) -> None:
+        """Add a member to the contest.
+
+        Args:
+            member: The member joining.
+
+        Raises:
+            ContestError: If the member is banned or already joined.
+        """
+        if member in self.banned_participants:
+            raise ContestError(BANNED_USER_TRY_JOIN.format(user=member.mention))
+        if member in self.participants:
+            raise ContestError(ALREADY_JOINED)
+        self.participants.add(member)
+        self.member_index.add(member)
+        self.wpm_results[member] = ["-"] * max(self.round - 1, 0)
+
+    def quit(self, member: discord.Member) -> None:
+        """Remove a member who leaves the contest.
+
+        Args:
+            member: The member leaving.
+
+        Raises:
+            ContestError: If the member is not in the contest.
+        """
+        if member not in self.participants:
+            raise ContestError(NOT_IN_CONTEST)
+        self.participants.remove(member)
+        self.member_index.discard(member)
+        self.wpm_results.pop(member)
+
+    def remove(self, member: discord.Member) -> None:
+        """Remove a participant on behalf of the contest creator.
+
+        Args:
+            member: The participant to remove.
+
+        Raises:
+            ContestError: If the member is not in the contest.
+        """
+        if member not in self.participants:
+            raise ContestError(MEMBER_NOT_IN_CONTEST.format(member=member))
+        self.participants.remove(member)
+        self.member_index.discard(member)
+        self.wpm_results.pop(member, None)
+
+    def ban(self, member: discord.Member) -> None:
+        """Ban a participant on behalf of the contest creator.
+
+        Args:
+            member: The participant to ban.
+
+        Raises:
+            ContestError: If the member is not in the contest.
+        """
+        self.remove(member)
+        self.banned_participants.add(member)
+        self.member_index.add(member)
+
+    def list_participants(self) -> list[discord.Member]:
+        """Return the current participants.
+
+        Returns:
+            list[discord.Member]: The participants.
+        """
+        return list(self.participants)
+
+    def advance_round(self) -> tuple[list[list[str]], int]:
+        """Close the current round and start the next one.
+
+        Returns:
+            tuple[list[list[str]], int]: The result rows of the rounds so far
+            and the new round number.
+
+        Raises:
+            ContestError: If nobody has submitted a WPM since the last
+                `!next`.
+        """
+        if self.last_next_used:
+            raise ContestError(MUST_SUBMIT_WPM)
+        self.pad_missing_results()
+        wpm_result_rows = self.get_wpm_result_rows()
+        self.round += 1
+        self.last_next_used = True
+        return wpm_result_rows, self.round
+
+    def submit_wpm(self, member: discord.Member, wpm: str) -> bool:
+        """Record a participant's WPM for the current round.
+
+        A WPM that is out of line with the participant's earlier rounds or
+        with the rest of the round is recorded as flagged. A flagged WPM
+        disqualifies the participant's average until the creator confirms it
+        or holds it back.
+
+        Args:
+            member: The participant submitting.
+            wpm: The submitted WPM.
+
+        Returns:
+            bool: True if the WPM was flagged as suspicious.
+
+        Raises:
+            ContestError: If the member is not in the contest, no round has
+                started or the WPM is not a positive integer.
+        """
+        if member not in self.participants:
+            raise ContestError(NOT_IN_CONTEST)
+        if self.round == 0:
+            raise ContestError(ROUND_NOT_STARTED)
+        if not wpm.isdigit() or int(wpm) <= 0:
+            raise ContestError(INVALID_WPM)
+
+        if len(self.wpm_results[member]) != self.round:
+            self.wpm_results[member].append(wpm)
+        elif self.wpm_results[member][-1].isdigit():
+            # A resubmission replaces the accepted WPM of this round
+            self.forget_wpm(
+                member, self.round, int(self.wpm_results[member][-1])
+            )
+
+        flagged = self.is_suspicious(member, int(wpm))
+        if flagged:
+            self.wpm_results[member][-1] = wpm + FLAGGED_WPM_SUFFIX
+        else:
+            self.wpm_results[member][-1] = wpm
+            self.accept_wpm(member, self.round, int(wpm))
+        self.last_next_used = False
+        return flagged
+
+    def is_suspicious(self, member: discord.Member, wpm: int) -> bool:
+        """Check a WPM against the participant's history and the round.
+
+        A WPM in line with the participant's accepted WPMs, from this and
+        earlier contests, is never checked against the round: their own
+        history says more about them than the rest of the field does.
+
+        Args:
+            member: The participant submitting.
+            wpm: The submitted WPM.
+
+        Returns:
+            bool: True if the WPM should be confirmed by the creator.
+        """
+        if wpm > SUSPICIOUS_WPM_ABOVE:
+            return True
+
+        typist_stats = self.typist_stats.get(member.id)
+        if typist_stats is not None and typist_stats.count:
+            if (
+                typist_stats.z_score(wpm, ANOMALY_MIN_STD_WPM)
+                <= ANOMALY_Z_SCORE
+            ):
+                # In line with the typist's own accepted WPMs, so a typist
+                # who is always well ahead of the field is not flagged again
+                # every round
+                return False
+            if typist_stats.count >= ANOMALY_MIN_USER_SAMPLES:
+                return True
+
+        round_stats = self.round_stats.get(self.round)
+        return (
+            round_stats is not None
+            and round_stats.count >= ANOMALY_MIN_ROUND_SAMPLES
+            and round_stats.z_score(wpm, ANOMALY_MIN_STD_WPM) > ANOMALY_Z_SCORE
+        )
+
+    def accept_wpm(self, member: discord.Member, round: int, wpm: int) -> None:
+        """Add an accepted WPM to the running statistics.
+
+        Args:
+            member: The participant.
+            round: The round the WPM was submitted for.
+            wpm: The WPM.
+        """
+        self.typist_stats.setdefault(member.id, RunningStats()).add(wpm)
+        self.round_stats.setdefault(round, RunningStats()).add(wpm)
+
+    def forget_wpm(self, member: discord.Member, round: int, wpm: int) -> None:
+        """Remove a replaced WPM from the running statistics.
+
+        Args:
+            member: The participant.
+            round: The round the WPM was submitted for.
+            wpm: The WPM.
+        """
+        self.typist_stats[member.id].remove(wpm)
+        self.round_stats[round].remove(wpm)
+
+    def flagged_rounds(self, member: discord.Member) -> list[int]:
+        """Return the indexes of a participant's flagged results.
+
+        Args:
+            member: The participant.
+
+        Returns:
+            list[int]: The indexes into the participant's results.
+
+        Raises:
+            ContestError: If the participant has no flagged result.
+        """
+        flagged = [
+            i
+            for i, wpm in enumerate(self.wpm_results.get(member, []))
+            if wpm.endswith(FLAGGED_WPM_SUFFIX)
+        ]
+        if not flagged:
+            raise ContestError(NO_FLAGGED_WPM.format(member=member.mention))
+        return flagged
+
+    def confirm_wpm(self, member: discord.Member) -> list[str]:
+        """Accept every flagged WPM of a participant.
+
+        Args:
+            member: The participant.
+
+        Returns:
+            list[str]: The confirmed WPMs.
+
+        Raises:
+            ContestError: If the participant has no flagged result.
+        """
+        confirmed = []
+        for i in self.flagged_rounds(member):
+            wpm = self.wpm_results[member][i].removesuffix(FLAGGED_WPM_SUFFIX)
+            self.wpm_results[member][i] = wpm
+            self.accept_wpm(member, i + 1, int(wpm))
+            confirmed.append(wpm)
+        return confirmed
+
+    def hold_wpm(self, member: discord.Member) -> list[str]:
+        """Hold back every flagged WPM of a participant.
+
+        Held results count as missing, so they are left out of the averages
+        and the top three. The participant can still resubmit during the
+        current round.
+
+        Args:
+            member: The participant.
+
+        Returns:
+            list[str]: The held WPMs.
+
+        Raises:
+            ContestError: If the participant has no flagged result.
+        """
+        held = []
+        for i in reversed(self.flagged_rounds(member)):
+            held.append(
+                self.wpm_results[member][i].removesuffix(FLAGGED_WPM_SUFFIX)
+            )
+            if i == self.round - 1:
+                # Still pending for the current round
+                self.wpm_results[member].pop()
+            else:
+                self.wpm_results[member][i] = "-"
+        return held[::-1]
+
+    def pending_participants(self) -> list[discord.Member]:
+        """Return the participants who have not submitted this round.
+
+        Returns:
+            list[discord.Member]: The pending participants.
+        """
+        return [
+            participant
+            for participant in self.participants
+            if len(self.wpm_results[participant]) < self.round
+        ]
+
+    def finish(
+        self,
+    ) -> tuple[
+        list[list[str]],
+        list[tuple[discord.Member, float]],
+        list[discord.Member],
+    ]:
+        """End the contest and compute the final results.
+
+        Every transition queued after this one is rejected.
+
+        Returns:
+            tuple: The final result rows, the top three participants with
+            their average WPM, and the participants of the contest.
+        """
+        self.pad_missing_results()
+
+        if self.last_next_used:
+            self.round -= 1
+            for participant in self.participants:
+                if self.wpm_results[participant]:
+                    self.wpm_results[participant].pop()
+
+        wpm_result_rows = self.get_wpm_result_rows()
+        self.active = False
+        return (
+            wpm_result_rows,
+            self.top_three_participants,
+            list(self.participants),
+        )
+
+    def get_wpm_result_table(self) -> str:
+        """Generate and return a table of WPM results for all participants.
+
+        Returns:
+            str: The formatted WPM result table.
+        """
+        return format_wpm_result_table(self.get_wpm_result_rows())
+
+    def get_wpm_result_rows(self) -> list[list[str]]:
+        """Generate the rows of the WPM result table for all participants.
+
+        This also updates the participant averages and the top three.
+
+        Returns:
+            list[list[str]]: The header row followed by one row per
+            participant.
+        """
+        wpm_result_rows = [
+            ["Typist \\ Round"]
+            + [str(i + 1) for i in range(self.round)]
+            + ["Avg WPM"]
+        ]
+
+        participant_averages: dict[discord.Member, float] = {}
+
+        for participant, wpm_list in self.wpm_results.items():
+            row = [participant.display_name]
+            row.extend(wpm_list)
+            average_wpm = "NQ"  # Not Qualified
+
+            if len(row) - 1 < self.round:
+                # Fill in the missing rounds with blank spaces
+                row.extend(["" for _ in range(self.round - len(row) + 1)])
+            elif (
+                len(wpm_list)
+                and "-" not in wpm_list
+                and not any(
+                    wpm.endswith(FLAGGED_WPM_SUFFIX) for wpm in wpm_list
+                )
+            ):
+                # Compute average WPM if valid
+                wpm_int_list = [int(wpm) for wpm in wpm_list]
+                average_wpm = f"{sum(wpm_int_list) / self.round:.2f}"
+                participant_averages[participant] = float(average_wpm)
+
+            row.append(average_wpm)
+
+            wpm_result_rows.append(row)
+
+        self.participant_averages = participant_averages
+        self.top_three_participants = sorted(
+            participant_averages.items(), key=lambda x: x[1], reverse=True
+        )[:3]
+
+        return wpm_result_rows
+
+    def snapshot(self) -> dict:
+        """Return a JSON-compatible snapshot of the contest state.
+
+        Members and channels are identified by their IDs, so snapshots taken
+        from a live bot and from a replay can be compared directly.
+
+        Returns:
+            dict: The snapshot of the contest state.
+        """
+        return {
+            "contest_active": self.active,
+            "contest_creator": self.creator.id,
+            "contest_channel": self.channel.id,
+            "participants": sorted(p.id for p in self.participants),
+            "banned_participants": sorted(
+                p.id for p in self.banned_participants
+            ),
+            "round": self.round,
+            "last_next_used": self.last_next_used,
+            "wpm_results": {
+                str(participant.id): wpm_list
+                for participant, wpm_list in self.wpm_results.items()
+            },
+        }
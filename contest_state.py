@@ -0,0 +1,111 @@
+import asyncio
+import os
+import weakref
+
+import discord
+
+from constants import (
+    CONFIG_JSON_FILE_PATH,
+    RATING_HISTORY_FILE_NAME,
+    RATINGS_JSON_FILE_NAME,
+)
+from contest import Contest
+from tournament import Tournament
+from utils.rating import RatingBook
+from utils.result_image import ResultImageRenderer
+from utils.running_stats import RunningStats
+from utils.scoreboard import LiveScoreboard
+from utils.trace import TraceRecorder
+
+
+class ContestState:
+    """Everything the contest cog keeps between commands.
+
+    The state is owned by the bot rather than by the cog, so reloading the cog
+    hands the running contests, their worker tasks and the live scoreboards
+    to the new version untouched. Only the cog module is reloaded; `Contest`,
+    `Tournament` and the helpers in `utils` keep their classes, so the objects
+    held here stay valid across reloads.
+
+    Attributes:
+        debug: Debug flag for testing purposes.
+        config_file_path: The path of the JSON config file.
+        trace_recorder: Records incoming commands when tracing is enabled.
+        contests: The active contests by channel ID.
+        tournament: The running tournament, or None.
+        scoreboards: The live scoreboards of the active contests by channel ID.
+        image_channels: The IDs of the contest channels that get result tables
+            as images.
+        result_images: Renders the result images.
+        ratings: The skill ratings of every typist, stored next to the config
+            file.
+        typist_stats: Running statistics of every typist's accepted WPMs by
+            ID, across all contests, to check new WPMs against.
+        participant_role: The temporary role assigned to participants during the contest.
+        participant_role_lock: Ensures the participant role is created once.
+        participant_role_locks: Serialize the participant role changes of
+            each member by ID, for as long as any change is in flight.
+    """
+
+    def __init__(
+        self,
+        debug: bool,
+        trace_recorder: TraceRecorder | None = None,
+        config_file_path: str = CONFIG_JSON_FILE_PATH,
+    ) -> None:
+        """Initialize the state with no contest running.
+
+        Args:
+            debug: If true, enable debugging behavior.
+            trace_recorder: If given, every command is recorded to its trace.
+            config_file_path: The path of the JSON config file.
+        """
+        self.debug: bool = debug
+        self.config_file_path: str = config_file_path
+        self.trace_recorder: TraceRecorder | None = trace_recorder
+        self.contests: dict[int, Contest] = {}
+        self.tournament: Tournament | None = None
+        self.scoreboards: dict[int, LiveScoreboard] = {}
+        self.image_channels: set[int] = set()
+        self.result_images: ResultImageRenderer = ResultImageRenderer()
+        config_dir = os.path.dirname(config_file_path)
+        self.ratings: RatingBook = RatingBook(
+            os.path.join(config_dir, RATINGS_JSON_FILE_NAME),
+            os.path.join(config_dir, RATING_HISTORY_FILE_NAME),
+        )
+        self.typist_stats: dict[int, RunningStats] = {}
+        self.participant_role: discord.Role | None = None
+        self.participant_role_lock: asyncio.Lock = asyncio.Lock()
+        self.participant_role_locks: weakref.WeakValueDictionary[
+            int, asyncio.Lock
+        ] = weakref.WeakValueDictionary()
+
+    def snapshot(self) -> dict:
+        """Return a JSON-compatible snapshot of the contest state.
+
+        Returns:
+            dict: The snapshots of the active contests by channel ID, and of
+            the running tournament, if any.
+        """
+        return {
+            "contests": {
+                str(channel_id): contest.snapshot()
+                for channel_id, contest in self.contests.items()
+                if contest.active
+            },
+            "tournament": (
+                self.tournament.snapshot() if self.tournament else None
+            ),
+        }
+
+    def close(self) -> None:
+        """Stop the background work and write the final state to the trace.
+
+        This is called once when the bot shuts down, never on a reload.
+        """
+        for scoreboard in self.scoreboards.values():
+            scoreboard.task.cancel()
+        self.result_images.close()
+        if self.trace_recorder:
+            self.trace_recorder.record_state(self.snapshot())
+            self.trace_recorder.close()
@@ -5,10 +5,16 @@ import logging
 import os
 
 import discord
+import yarl
 from discord.ext import commands
+from discord.gateway import DiscordWebSocket
 
-from cogs.typing_contest import TypingContestBot
-from constants import CONFIG_JSON_FILE_PATH
+from constants import CONFIG_JSON_FILE_PATH, MEMBER_NOT_IN_GUILD
+from contest_state import ContestState
+from utils.admission import AdmissionControl
+from utils.dispatch_filter import DispatchFilter
+from utils.member_index import AmbiguousMember
+from utils.trace import TraceRecorder
 
 
 def parse_args() -> argparse.Namespace:
@@ -21,6 +27,17 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--debug", action="store_true", help="Enable debug mode"
     )
+    parser.add_argument(
+        "--trace",
+        metavar="PATH",
+        help="Record every command to a JSONL trace file for later replay",
+    )
+    parser.add_argument(
+        "--api-base-url",
+        metavar="URL",
+        help="Connect to a local stand-in for the Discord API, e.g. the one "
+        "started by `python -m tools.fake_discord --serve`",
+    )
     return parser.parse_args()
 
 
@@ -68,29 +85,176 @@ def load_config(file_path: str, debug: bool) -> dict:
     return config
 
 
+class ContestBot(commands.Bot):
+    """A `commands.Bot` that filters messages before dispatching commands.
+
+    Messages that pass the filter then go through admission control, which
+    drops commands from users, channels and guilds that send too many.
+
+    The bot also owns the contest state, so the contest cog can be reloaded
+    without losing it. While an extension is being reloaded, incoming
+    commands wait for it to be loaded again instead of being dropped.
+
+    Attributes:
+        dispatch_filter: Decides which messages are worth dispatching. The
+            command table is recompiled whenever a command is added or
+            removed, and the cog keeps the contest channels up to date.
+        admission_control: Rate limits commands per user, channel and guild.
+        contest_state: The state of the contest cog, set up before the cog
+            is loaded.
+        commands_resumed: Cleared while an extension is being reloaded.
+    """
+
+    def __init__(self, command_prefix: str, **options) -> None:
+        """Initializes the bot and its dispatch filter.
+
+        Args:
+            command_prefix: The command prefix.
+            **options: Passed on to `commands.Bot`.
+        """
+        self.dispatch_filter: DispatchFilter = DispatchFilter(command_prefix)
+        self.admission_control: AdmissionControl = AdmissionControl()
+        self.contest_state: ContestState | None = None
+        self.commands_resumed: asyncio.Event = asyncio.Event()
+        self.commands_resumed.set()
+        super().__init__(command_prefix=command_prefix, **options)
+
+    def add_command(self, command: commands.Command, /) -> None:
+        """Adds a command and recompiles the dispatch filter's table."""
+        super().add_command(command)
+        self.dispatch_filter.compile_commands(self.commands)
+
+    def remove_command(self, name: str, /) -> commands.Command | None:
+        """Removes a command and recompiles the dispatch filter's table."""
+        command = super().remove_command(name)
+        self.dispatch_filter.compile_commands(self.commands)
+        return command
+
+    async def process_commands(self, message: discord.Message, /) -> None:
+        """Processes commands in a message that passes the dispatch filter.
+
+        Args:
+            message: The incoming message.
+        """
+        if message.author.bot:
+            return
+        # Returns at once unless an extension is being reloaded
+        await self.commands_resumed.wait()
+        if not self.dispatch_filter.should_dispatch(message):
+            return
+
+        admitted, reply = self.admission_control.admit(
+            message, exempt=self.is_contest_creator(message.author)
+        )
+        if not admitted:
+            if reply is not None:
+                await message.channel.send(reply)
+            return
+        await super().process_commands(message)
+
+    def is_contest_creator(self, user: discord.abc.User) -> bool:
+        """Check whether a user runs an active contest or tournament.
+
+        Args:
+            user: The user to check.
+
+        Returns:
+            bool: True if the user created an active contest or the running
+            tournament.
+        """
+        state = self.contest_state
+        if state is None:
+            return False
+        if state.tournament is not None and state.tournament.creator == user:
+            return True
+        return any(
+            contest.creator == user for contest in state.contests.values()
+        )
+
+    async def reload_extension(
+        self, name: str, *, package: str | None = None
+    ) -> None:
+        """Reloads an extension, holding commands back until it is loaded.
+
+        Args:
+            name: The extension name.
+            package: The package to resolve a relative name against.
+        """
+        self.commands_resumed.clear()
+        try:
+            await super().reload_extension(name, package=package)
+        finally:
+            self.commands_resumed.set()
+
+    async def on_command_error(
+        self, context: commands.Context, exception: commands.CommandError
+    ) -> None:
+        """Replies to member arguments that could not be resolved.
+
+        Every other error is handled by the default handler.
+
+        Args:
+            context: The invocation context.
+            exception: The error raised by the command or its arguments.
+        """
+        if isinstance(exception, AmbiguousMember):
+            await context.reply(str(exception))
+        elif isinstance(exception, commands.MemberNotFound):
+            await context.reply(
+                MEMBER_NOT_IN_GUILD.format(member=exception.argument)
+            )
+        else:
+            await super().on_command_error(context, exception)
+
+    async def close(self) -> None:
+        """Closes the contest state, then the bot."""
+        if self.contest_state is not None:
+            self.contest_state.close()
+        await super().close()
+
+
 class BotSetup:
     """Handles setting up and running the Discord bot.
 
     Attributes:
         token: The bot token used for authentication.
         debug: Whether to enable debug mode.
+        trace_path: Path of the command trace file, if tracing is enabled.
+        config_file_path: Path of the JSON config file used by the cog.
         intents: Intents for the bot.
         bot: The bot instance.
     """
 
-    def __init__(self, token: str, debug: bool = False) -> None:
+    def __init__(
+        self,
+        token: str,
+        debug: bool = False,
+        trace_path: str | None = None,
+        api_base_url: str | None = None,
+        config_file_path: str = CONFIG_JSON_FILE_PATH,
+    ) -> None:
         """Initializes the bot setup with the token and debug mode.
 
         Args:
             token: The bot token.
             debug: If true, enables debug. Defaults to False.
+            trace_path: If given, record commands to this trace file.
+                Defaults to None.
+            api_base_url: If given, connect to the Discord API stand-in at
+                this URL instead of Discord. Defaults to None.
+            config_file_path: Path of the JSON config file used by the cog.
+                Defaults to `CONFIG_JSON_FILE_PATH`.
         """
         self.token: str = token
         self.debug: bool = debug
+        self.trace_path: str | None = trace_path
+        self.config_file_path: str = config_file_path
+        if api_base_url:
+            self.use_api_base_url(api_base_url)
         self.intents: discord.Intents = discord.Intents.default()
         self.intents.message_content = True
         self.intents.members = True
-        self.bot: commands.Bot = commands.Bot(
+        self.bot: ContestBot = ContestBot(
             command_prefix="!", intents=self.intents
         )
         self.setup_logging()
@@ -103,14 +267,44 @@ class BotSetup:
         handler.setFormatter(discord.utils._ColourFormatter())
         logger.addHandler(handler)
 
+    def use_api_base_url(self, api_base_url: str) -> None:
+        """Points the HTTP client and gateway at a Discord API stand-in.
+
+        The stand-in must serve the REST API under `/api/v10` and the gateway
+        websocket under `/gateway`, as `tools.fake_discord` does.
+
+        Args:
+            api_base_url: The base URL of the stand-in, e.g.
+                `http://127.0.0.1:8080`.
+        """
+        base_url = yarl.URL(api_base_url)
+        discord.http.Route.BASE = str(base_url / "api" / "v10")
+        gateway_scheme = "wss" if base_url.scheme == "https" else "ws"
+        DiscordWebSocket.DEFAULT_GATEWAY = base_url.with_scheme(
+            gateway_scheme
+        ).with_path("/gateway/")
+
     async def setup(self) -> None:
-        """Sets up the bot by adding necessary cog."""
-        await self.bot.add_cog(TypingContestBot(self.bot, self.debug))
+        """Sets up the bot by loading the contest cog with a fresh state."""
+        trace_recorder = (
+            TraceRecorder(self.trace_path) if self.trace_path else None
+        )
+        self.bot.contest_state = ContestState(
+            self.debug,
+            trace_recorder,
+            config_file_path=self.config_file_path,
+        )
+        await self.bot.load_extension("cogs.typing_contest")
 
     async def run(self) -> None:
-        """Runs the bot, connecting to Discord using the provided token."""
-        await self.setup()
-        await self.bot.start(self.token)
+        """Runs the bot, connecting to Discord using the provided token.
+
+        The bot is closed however it stops, Ctrl+C included, so the contest
+        state always writes its final snapshot to the trace.
+        """
+        async with self.bot:
+            await self.setup()
+            await self.bot.start(self.token)
 
 
 if __name__ == "__main__":
@@ -121,5 +315,10 @@ if __name__ == "__main__":
     config = load_config(CONFIG_JSON_FILE_PATH, debug=args.debug)
 
     # Initialize and run the bot
-    bot_instance = BotSetup(config["token"], debug=args.debug)
+    bot_instance = BotSetup(
+        config["token"],
+        debug=args.debug,
+        trace_path=args.trace,
+        api_base_url=args.api_base_url,
+    )
     asyncio.run(bot_instance.run())
@@ -0,0 +1,942 @@
+"""A local stand-in for the Discord gateway and REST API for load tests.
+
+Usage:
+    python -m tools.fake_discord [--users 1000] [--rounds 3] [--latency 0.05]
+        [--rate-limit-probability 0.01] [--channel-message-limit 5]
+        [--live-scoreboard] [--result-images]
+
+By default this starts the stand-in, runs the real bot from `main.BotSetup`
+against it and drives a whole contest with simulated users: the creator starts
+it, every user joins, and each round every user submits a WPM before the
+creator moves on with `!next` and finally `!end`. With `--live-scoreboard`
+the creator also posts a live scoreboard right after starting, and with
+`--result-images` turns on result images. Everything the bot sends is
+recorded and summarised when the contest is over.
+
+With `--serve` only the stand-in is started, so the bot can be run separately
+with `python main.py --api-base-url http://127.0.0.1:PORT`.
+
+The stand-in implements just enough of the API for the bot: the gateway
+handshake (HELLO, IDENTIFY, READY, GUILD_CREATE and heartbeats), the
+MESSAGE_CREATE event, and the REST routes for logging in, sending and editing
+messages, reacting, and creating and assigning roles. Every REST call can be delayed,
+and 429 responses are injected both at random and whenever a channel exceeds
+its message limit, so `discord.py`'s rate limit handling is exercised too.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import statistics
+import tempfile
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from aiohttp import WSMsgType, web
+
+from main import BotSetup
+from tools.fakes import FAKE_TYPIST_ROLE_NAME, write_fake_config
+
+GATEWAY_HELLO = 10
+GATEWAY_HEARTBEAT = 1
+GATEWAY_HEARTBEAT_ACK = 11
+GATEWAY_IDENTIFY = 2
+GATEWAY_PRESENCE = 3
+GATEWAY_DISPATCH = 0
+HEARTBEAT_INTERVAL_MS = 41250
+
+READY_TIMEOUT_SECONDS = 30
+RESPONSE_TIMEOUT_SECONDS = 60
+IDLE_SECONDS = 1.0
+
+
+def json_response(
+    data: object, status: int = 200, headers: dict | None = None
+) -> web.Response:
+    """Build a JSON response the way Discord sends it.
+
+    `discord.py` only parses bodies whose content type is exactly
+    `application/json`, so the charset aiohttp would append is left out.
+
+    Args:
+        data: The JSON-compatible body.
+        status: The HTTP status.
+        headers: Extra response headers.
+
+    Returns:
+        web.Response: The response.
+    """
+    return web.Response(
+        body=json.dumps(data).encode(),
+        status=status,
+        headers={"Content-Type": "application/json", **(headers or {})},
+    )
+
+
+@dataclass
+class RecordedRequest:
+    """A REST request the bot made to the stand-in.
+
+    Attributes:
+        method: The HTTP method.
+        route: The route template, e.g. `/channels/{channel_id}/messages`.
+        path: The concrete request path.
+        body: The JSON body of the request, if any.
+        status: The HTTP status the stand-in answered with.
+        timestamp: When the request arrived, from `time.perf_counter`.
+    """
+
+    method: str
+    route: str
+    path: str
+    body: dict | None
+    status: int
+    timestamp: float
+
+
+@dataclass
+class LoadReport:
+    """What happened during a load test.
+
+    Attributes:
+        requests: Every REST request the bot made, in order.
+        gateway_events_sent: The number of events sent over the gateway.
+        rate_limited: The number of 429 responses injected.
+        response_latencies: For every user command the bot answered, the
+            time between dispatching the command and the bot's first request
+            referencing it (a reply or a reaction), in seconds.
+    """
+
+    requests: list[RecordedRequest] = field(default_factory=list)
+    gateway_events_sent: int = 0
+    rate_limited: int = 0
+    response_latencies: list[float] = field(default_factory=list)
+
+    def summary(self) -> str:
+        """Summarise the report for printing.
+
+        Returns:
+            str: The human-readable summary.
+        """
+        route_counts = Counter(
+            f"{request.method} {request.route}" for request in self.requests
+        )
+        lines = [
+            f"Gateway events sent: {self.gateway_events_sent}",
+            f"REST requests received: {len(self.requests)}",
+            f"429 responses injected: {self.rate_limited}",
+        ]
+        lines.extend(
+            f"  {count:>7} {route}"
+            for route, count in route_counts.most_common()
+        )
+        latencies = sorted(self.response_latencies)
+        if latencies:
+            lines.append(
+                "Command response latency: "
+                f"mean {statistics.fmean(latencies) * 1000:.1f}ms, "
+                f"p50 {latencies[len(latencies) // 2] * 1000:.1f}ms, "
+                f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.1f}ms, "
+                f"max {latencies[-1] * 1000:.1f}ms"
+            )
+        return "\n".join(lines)
+
+
+class FakeDiscordServer:
+    """Serves a minimal Discord gateway and REST API on localhost.
+
+    Attributes:
+        host: The host to listen on.
+        port: The port to listen on, or 0 to pick a free one.
+        latency: Seconds every REST request is delayed by.
+        rate_limit_probability: The chance that a REST request gets a 429.
+        retry_after: The `retry_after` sent with injected 429 responses.
+        channel_message_limit: Messages and reactions allowed per channel in
+            every `channel_window` seconds before 429s are returned, or 0 for
+            no limit.
+        channel_window: The length of the per-channel window, in seconds.
+        report: Everything recorded so far.
+        guild_id: The ID of the only guild.
+        channel_id: The ID of the only text channel.
+        bot_user: The bot's user payload.
+        users: The simulated users' payloads.
+        roles: The guild's role payloads.
+        ready: Set once the bot has identified and updated its presence.
+    """
+
+    def __init__(
+        self,
+        users: int,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        rate_limit_probability: float = 0.0,
+        retry_after: float = 0.5,
+        channel_message_limit: int = 0,
+        channel_window: float = 5.0,
+    ) -> None:
+        """Initialize the stand-in and its guild.
+
+        Args:
+            users: The number of simulated users in the guild.
+            host: The host to listen on.
+            port: The port to listen on, or 0 to pick a free one.
+            latency: Seconds every REST request is delayed by.
+            rate_limit_probability: The chance that a REST request gets a 429.
+            retry_after: The `retry_after` sent with injected 429 responses.
+            channel_message_limit: Messages and reactions allowed per channel
+                in every `channel_window` seconds, or 0 for no limit.
+            channel_window: The length of the per-channel window, in seconds.
+        """
+        self.host: str = host
+        self.port: int = port
+        self.latency: float = latency
+        self.rate_limit_probability: float = rate_limit_probability
+        self.retry_after: float = retry_after
+        self.channel_message_limit: int = channel_message_limit
+        self.channel_window: float = channel_window
+        self.report: LoadReport = LoadReport()
+        self.ready: asyncio.Event = asyncio.Event()
+
+        self._snowflakes = itertools.count(100_000_000_000_000_000)
+        self._sequence = itertools.count(1)
+        self._sockets: set[web.WebSocketResponse] = set()
+        self._channel_activity: dict[str, deque[float]] = {}
+        self._pending_commands: dict[str, float] = {}
+        self._bot_messages: list[dict] = []
+        self._bot_message_added: asyncio.Condition = asyncio.Condition()
+        self._runner: web.AppRunner | None = None
+        self._last_request_at: float = time.perf_counter()
+
+        self.guild_id: str = self.new_snowflake()
+        self.channel_id: str = self.new_snowflake()
+        self.bot_user: dict = self.user_payload(self.new_snowflake(), "bot")
+        self.bot_user["bot"] = True
+        self.users: list[dict] = [
+            self.user_payload(self.new_snowflake(), f"typist{i}")
+            for i in range(users)
+        ]
+        self.roles: list[dict] = [
+            self.role_payload(self.guild_id, "@everyone", position=0),
+            self.role_payload(
+                self.new_snowflake(), FAKE_TYPIST_ROLE_NAME, position=1
+            ),
+        ]
+
+    @property
+    def url(self) -> str:
+        """str: The base URL to pass to `BotSetup`."""
+        return f"http://{self.host}:{self.port}"
+
+    def new_snowflake(self) -> str:
+        """Return a new unique ID.
+
+        Returns:
+            str: The ID, as Discord sends it.
+        """
+        return str(next(self._snowflakes))
+
+    @staticmethod
+    def timestamp() -> str:
+        """Return the current time in Discord's ISO 8601 format.
+
+        Returns:
+            str: The current time.
+        """
+        return datetime.now(timezone.utc).isoformat()
+
+    @staticmethod
+    def user_payload(user_id: str, name: str) -> dict:
+        """Build a user payload.
+
+        Args:
+            user_id: The user's ID.
+            name: The user's name.
+
+        Returns:
+            dict: The user payload.
+        """
+        return {
+            "id": user_id,
+            "username": name,
+            "global_name": name,
+            "discriminator": "0",
+            "avatar": None,
+        }
+
+    @staticmethod
+    def role_payload(role_id: str, name: str, position: int) -> dict:
+        """Build a role payload.
+
+        Args:
+            role_id: The role's ID.
+            name: The role's name.
+            position: The role's position in the hierarchy.
+
+        Returns:
+            dict: The role payload.
+        """
+        return {
+            "id": role_id,
+            "name": name,
+            "color": 0,
+            "hoist": False,
+            "position": position,
+            "permissions": "0",
+            "managed": False,
+            "mentionable": True,
+            "flags": 0,
+        }
+
+    def member_payload(self, user: dict) -> dict:
+        """Build a guild member payload for a user.
+
+        Args:
+            user: The user payload.
+
+        Returns:
+            dict: The member payload.
+        """
+        return {
+            "user": user,
+            "roles": [],
+            "joined_at": self.timestamp(),
+            "deaf": False,
+            "mute": False,
+            "flags": 0,
+        }
+
+    def message_payload(self, author: dict, content: str) -> dict:
+        """Build a message payload for the guild's text channel.
+
+        Args:
+            author: The author's user payload.
+            content: The message content.
+
+        Returns:
+            dict: The message payload.
+        """
+        member = self.member_payload(author)
+        del member["user"]
+        return {
+            "id": self.new_snowflake(),
+            "type": 0,
+            "channel_id": self.channel_id,
+            "guild_id": self.guild_id,
+            "author": author,
+            "member": member,
+            "content": content,
+            "timestamp": self.timestamp(),
+            "edited_timestamp": None,
+            "tts": False,
+            "mention_everyone": False,
+            "mentions": [],
+            "mention_roles": [],
+            "attachments": [],
+            "embeds": [],
+            "pinned": False,
+        }
+
+    def guild_payload(self) -> dict:
+        """Build the GUILD_CREATE payload for the guild.
+
+        Every member is included and `member_count` matches, so the bot sees
+        the guild as fully chunked and does not request members.
+
+        Returns:
+            dict: The guild payload.
+        """
+        members = [
+            self.member_payload(user) for user in [self.bot_user, *self.users]
+        ]
+        return {
+            "id": self.guild_id,
+            "name": "Load Test Guild",
+            "icon": None,
+            "owner_id": self.users[0]["id"] if self.users else "0",
+            "unavailable": False,
+            "large": len(members) > 250,
+            "member_count": len(members),
+            "members": members,
+            "roles": self.roles,
+            "channels": [
+                {
+                    "id": self.channel_id,
+                    "type": 0,
+                    "name": "typing-contest",
+                    "position": 0,
+                    "permission_overwrites": [],
+                }
+            ],
+            "threads": [],
+            "emojis": [],
+            "stickers": [],
+            "features": [],
+            "presences": [],
+            "voice_states": [],
+        }
+
+    async def start(self) -> None:
+        """Start listening for the bot."""
+        app = web.Application()
+        app.router.add_get("/gateway/", self.handle_gateway)
+        app.router.add_route("*", "/api/v10/{path:.*}", self.handle_rest)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Close every gateway connection and stop listening."""
+        for socket in list(self._sockets):
+            await socket.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def send_gateway(
+        self,
+        socket: web.WebSocketResponse,
+        op: int,
+        data: object,
+        event: str | None = None,
+    ) -> None:
+        """Send a single gateway payload.
+
+        Args:
+            socket: The gateway connection.
+            op: The gateway opcode.
+            data: The payload's `d` field.
+            event: The event name for dispatches.
+        """
+        payload = {"op": op, "d": data, "s": None, "t": event}
+        if op == GATEWAY_DISPATCH:
+            payload["s"] = next(self._sequence)
+            self.report.gateway_events_sent += 1
+        await socket.send_str(json.dumps(payload))
+
+    async def dispatch(self, event: str, data: dict) -> None:
+        """Dispatch a gateway event to every connected bot.
+
+        Args:
+            event: The event name.
+            data: The event payload.
+        """
+        for socket in list(self._sockets):
+            await self.send_gateway(socket, GATEWAY_DISPATCH, data, event)
+
+    async def handle_gateway(self, request: web.Request) -> web.StreamResponse:
+        """Serve a gateway connection.
+
+        Args:
+            request: The websocket upgrade request.
+
+        Returns:
+            web.StreamResponse: The closed websocket.
+        """
+        socket = web.WebSocketResponse()
+        await socket.prepare(request)
+        self._sockets.add(socket)
+        await self.send_gateway(
+            socket, GATEWAY_HELLO, {"heartbeat_interval": HEARTBEAT_INTERVAL_MS}
+        )
+        try:
+            async for message in socket:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                payload = json.loads(message.data)
+                op = payload["op"]
+                if op == GATEWAY_HEARTBEAT:
+                    await self.send_gateway(socket, GATEWAY_HEARTBEAT_ACK, None)
+                elif op == GATEWAY_IDENTIFY:
+                    await self.send_gateway(
+                        socket,
+                        GATEWAY_DISPATCH,
+                        {
+                            "v": 10,
+                            "user": self.bot_user,
+                            "guilds": [
+                                {"id": self.guild_id, "unavailable": True}
+                            ],
+                            "session_id": self.new_snowflake(),
+                            "resume_gateway_url": f"ws://{self.host}:{self.port}/gateway/",
+                            "application": {
+                                "id": self.bot_user["id"],
+                                "flags": 0,
+                            },
+                        },
+                        "READY",
+                    )
+                    await self.send_gateway(
+                        socket,
+                        GATEWAY_DISPATCH,
+                        self.guild_payload(),
+                        "GUILD_CREATE",
+                    )
+                elif op == GATEWAY_PRESENCE:
+                    # The cog updates its presence once it is ready
+                    self.ready.set()
+        finally:
+            self._sockets.discard(socket)
+        return socket
+
+    def is_rate_limited(self, bucket: str | None) -> bool:
+        """Decide whether to answer a request with a 429.
+
+        Args:
+            bucket: The channel the request counts against, if any.
+
+        Returns:
+            bool: True if the request should be rejected.
+        """
+        if random.random() < self.rate_limit_probability:
+            return True
+        if bucket is None or not self.channel_message_limit:
+            return False
+
+        now = time.perf_counter()
+        activity = self._channel_activity.setdefault(bucket, deque())
+        while activity and now - activity[0] > self.channel_window:
+            activity.popleft()
+        if len(activity) >= self.channel_message_limit:
+            return True
+        activity.append(now)
+        return False
+
+    def record_response_latency(self, message_id: str | None) -> None:
+        """Record the latency of the bot's first response to a command.
+
+        Args:
+            message_id: The ID of the command message being answered.
+        """
+        started_at = self._pending_commands.pop(message_id, None)
+        if started_at is not None:
+            self.report.response_latencies.append(
+                time.perf_counter() - started_at
+            )
+
+    async def handle_rest(self, request: web.Request) -> web.Response:
+        """Serve a REST request.
+
+        Args:
+            request: The request.
+
+        Returns:
+            web.Response: The response.
+        """
+        arrived_at = self._last_request_at = time.perf_counter()
+        path = "/" + request.match_info["path"]
+        parts = path.strip("/").split("/")
+        body = await self.read_body(request)
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        route, bucket, handler = self.resolve_route(request.method, parts)
+        if self.is_rate_limited(bucket):
+            self.report.rate_limited += 1
+            self.report.requests.append(
+                RecordedRequest(
+                    request.method, route, path, body, 429, arrived_at
+                )
+            )
+            return json_response(
+                {
+                    "message": "You are being rate limited.",
+                    "retry_after": self.retry_after,
+                    "global": False,
+                },
+                status=429,
+                headers={
+                    "Via": "1.1 google",
+                    "Retry-After": str(self.retry_after),
+                    "X-RateLimit-Scope": "user",
+                },
+            )
+
+        status, data = await handler(parts, body)
+        self.report.requests.append(
+            RecordedRequest(
+                request.method, route, path, body, status, arrived_at
+            )
+        )
+        if status == 204:
+            return web.Response(status=204)
+        return json_response(data, status=status)
+
+    async def read_body(self, request: web.Request) -> dict | None:
+        """Read the JSON body of a request, also from multipart uploads.
+
+        Args:
+            request: The request.
+
+        Returns:
+            dict | None: The JSON body, or None if there is none.
+        """
+        if not request.can_read_body:
+            return None
+        if request.content_type != "multipart/form-data":
+            return await request.json()
+        # Messages with attachments carry their JSON in a form field
+        form = await request.post()
+        payload = form.get("payload_json")
+        return json.loads(payload) if payload else None
+
+    def resolve_route(self, method: str, parts: list[str]) -> tuple:
+        """Map a request onto its route template, rate limit bucket and handler.
+
+        Args:
+            method: The HTTP method.
+            parts: The path segments after `/api/v10`.
+
+        Returns:
+            tuple: The route template, the rate limit bucket and the handler.
+            Handlers take the path segments and the JSON body and return the
+            status and the response body.
+        """
+        match method, parts:
+            case "GET", ["users", "@me"]:
+                return "/users/@me", None, self.get_current_user
+            case "GET", ["oauth2", "applications", "@me"]:
+                return "/oauth2/applications/@me", None, self.get_application
+            case "GET", ["gateway", *_]:
+                return "/gateway", None, self.get_gateway
+            case "POST", ["channels", channel_id, "messages"]:
+                return (
+                    "/channels/{channel_id}/messages",
+                    channel_id,
+                    self.create_message,
+                )
+            case "PATCH", ["channels", channel_id, "messages", _]:
+                return (
+                    "/channels/{channel_id}/messages/{message_id}",
+                    channel_id,
+                    self.edit_message,
+                )
+            case "PUT", [
+                "channels",
+                channel_id,
+                "messages",
+                _,
+                "reactions",
+                *_,
+            ]:
+                return (
+                    "/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me",
+                    channel_id,
+                    self.add_reaction,
+                )
+            case (("PUT" | "DELETE"), ["channels", channel_id, "pins", _]):
+                return (
+                    "/channels/{channel_id}/pins/{message_id}",
+                    channel_id,
+                    self.no_content,
+                )
+            case "POST", ["guilds", _, "roles"]:
+                return "/guilds/{guild_id}/roles", None, self.create_role
+            case (("PUT" | "DELETE"), ["guilds", _, "members", _, "roles", _]):
+                return (
+                    "/guilds/{guild_id}/members/{user_id}/roles/{role_id}",
+                    None,
+                    self.no_content,
+                )
+        return "/" + "/".join(parts), None, self.no_content
+
+    async def get_current_user(
+        self, parts: list[str], body: dict | None
+    ) -> tuple[int, object]:
+        """Answer the login request with the bot's user."""
+        return 200, self.bot_user
+
+    async def get_application(
+        self, parts: list[str], body: dict | None
+    ) -> tuple[int, object]:
+        """Answer the application info request made during login."""
+        return 200, {
+            "id": self.bot_user["id"],
+            "name": self.bot_user["username"],
+            "description": "",
+            "icon": None,
+            "bot_public": False,
+            "bot_require_code_grant": False,
+            "owner": self.users[0] if self.users else self.bot_user,
+            "verify_key": "",
+            "flags": 0,
+        }
+
+    async def get_gateway(
+        self, parts: list[str], body: dict | None
+    ) -> tuple[int, object]:
+        """Return the gateway URL."""
+        return 200, {
+            "url": f"ws://{self.host}:{self.port}/gateway/",
+            "shards": 1,
+        }
+
+    async def create_message(
+        self, parts: list[str], body: dict | None
+    ) -> tuple[int, object]:
+        """Create a message from the bot and echo it over the gateway."""
+        body = body or {}
+        reference = body.get("message_reference") or {}
+        self.record_response_latency(reference.get("message_id"))
+
+        message = self.message_payload(self.bot_user, body.get("content") or "")
+        message["channel_id"] = parts[1]
+        message["embeds"] = body.get("embeds") or []
+        async with self._bot_message_added:
+            self._bot_messages.append(message)
+            self._bot_message_added.notify_all()
+        await self.dispatch("MESSAGE_CREATE", message)
+        return 200, message
+
+    async def edit_message(
+        self, parts: list[str], body: dict | None
+    ) -> tuple[int, object]:
+        """Edit a message from the bot."""
+        message = self.message_payload(
+            self.bot_user, (body or {}).get("content") or ""
+        )
+        message["id"] = parts[3]
+        message["channel_id"] = parts[1]
+        message["edited_timestamp"] = self.timestamp()
+        return 200, message
+
+    async def add_reaction(
+        self, parts: list[str], body: dict | None
+    ) -> tuple[int, object]:
+        """Accept a reaction from the bot."""
+        self.record_response_latency(parts[3])
+        return 204, None
+
+    async def create_role(
+        self, parts: list[str], body: dict | None
+    ) -> tuple[int, object]:
+        """Create a role and announce it over the gateway."""
+        role = self.role_payload(
+            self.new_snowflake(),
+            (body or {}).get("name", "new role"),
+            position=len(self.roles),
+        )
+        self.roles.append(role)
+        await self.dispatch(
+            "GUILD_ROLE_CREATE", {"guild_id": self.guild_id, "role": role}
+        )
+        return 200, role
+
+    async def no_content(
+        self, parts: list[str], body: dict | None
+    ) -> tuple[int, object]:
+        """Accept any other request without doing anything."""
+        return 204, None
+
+    async def send_command(self, user: dict, content: str) -> None:
+        """Send a message from a simulated user to the bot.
+
+        Args:
+            user: The user payload of the author.
+            content: The message content, e.g. `!wpm 80`.
+        """
+        message = self.message_payload(user, content)
+        self._pending_commands[message["id"]] = time.perf_counter()
+        await self.dispatch("MESSAGE_CREATE", message)
+
+    async def wait_for_bot_message(self, text: str, after: int) -> int:
+        """Wait for the bot to send a message containing `text`.
+
+        Args:
+            text: The text to look for.
+            after: Only consider messages sent after this many bot messages.
+
+        Returns:
+            int: The number of bot messages sent so far.
+        """
+        async with self._bot_message_added:
+            await asyncio.wait_for(
+                self._bot_message_added.wait_for(
+                    lambda: any(
+                        text in message["content"]
+                        for message in self._bot_messages[after:]
+                    )
+                ),
+                RESPONSE_TIMEOUT_SECONDS,
+            )
+            return len(self._bot_messages)
+
+    async def wait_until_idle(self, idle_seconds: float = IDLE_SECONDS) -> None:
+        """Wait until the bot has made no REST request for a while.
+
+        Args:
+            idle_seconds: How long the bot must stay quiet, in seconds.
+        """
+        while True:
+            quiet_for = time.perf_counter() - self._last_request_at
+            if quiet_for >= idle_seconds:
+                return
+            await asyncio.sleep(idle_seconds - quiet_for)
+
+
+async def simulate_contest(
+    server: FakeDiscordServer,
+    rounds: int,
+    message_rate: float,
+    live_scoreboard: bool = False,
+    result_images: bool = False,
+) -> None:
+    """Drive a whole contest through the stand-in with simulated users.
+
+    The creator waits for the bot to confirm `!start` and every `!next`
+    before the users react to it, as real users would.
+
+    Args:
+        server: The running stand-in.
+        rounds: The number of rounds to play.
+        message_rate: User messages sent per second, or 0 for no pacing.
+        live_scoreboard: Whether the creator posts a live scoreboard.
+        result_images: Whether the creator turns on result images.
+    """
+    creator = server.users[0]
+    pause = 1 / message_rate if message_rate else 0
+
+    async def send_all(make_content) -> None:
+        for user in server.users:
+            await server.send_command(user, make_content(user))
+            await asyncio.sleep(pause)
+
+    seen = 0
+    await server.send_command(creator, "!start")
+    seen = await server.wait_for_bot_message("has started", seen)
+    if live_scoreboard:
+        await server.send_command(creator, "!scoreboard")
+        seen = await server.wait_for_bot_message("Live WPM result table", seen)
+    if result_images:
+        await server.send_command(creator, "!images")
+        seen = await server.wait_for_bot_message("posted as images", seen)
+    await send_all(lambda user: "!join")
+    for round_number in range(1, rounds + 1):
+        await server.send_command(creator, "!next")
+        seen = await server.wait_for_bot_message(
+            f"Round {round_number} is starting", seen
+        )
+        await send_all(lambda user: f"!wpm {random.randint(40, 160)}")
+    await server.send_command(creator, "!end")
+    await server.wait_for_bot_message("has ended", seen)
+    # Let the bot finish answering, including rate-limited retries
+    await server.wait_until_idle(max(IDLE_SECONDS, server.retry_after * 2))
+
+
+def parse_args() -> argparse.Namespace:
+    """Parses command-line arguments.
+
+    Returns:
+        argparse.Namespace: A namespace containing the parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Local Discord stand-in for end-to-end load tests"
+    )
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument(
+        "--message-rate",
+        type=float,
+        default=0,
+        help="User messages per second, 0 (the default) for no pacing",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="REST latency in seconds"
+    )
+    parser.add_argument("--rate-limit-probability", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=0.5)
+    parser.add_argument(
+        "--channel-message-limit",
+        type=int,
+        default=0,
+        help="Messages and reactions per channel per window before 429s",
+    )
+    parser.add_argument("--channel-window", type=float, default=5.0)
+    parser.add_argument(
+        "--live-scoreboard",
+        action="store_true",
+        help="Have the creator post a live scoreboard",
+    )
+    parser.add_argument(
+        "--result-images",
+        action="store_true",
+        help="Have the creator turn on result images",
+    )
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Only run the stand-in, for a bot started separately",
+    )
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run the stand-in, and unless `--serve` is given, a full load test.
+
+    Args:
+        args: The parsed command-line arguments.
+    """
+    random.seed(args.seed)
+    server = FakeDiscordServer(
+        users=args.users,
+        port=args.port,
+        latency=args.latency,
+        rate_limit_probability=args.rate_limit_probability,
+        retry_after=args.retry_after,
+        channel_message_limit=args.channel_message_limit,
+        channel_window=args.channel_window,
+    )
+    await server.start()
+    print(f"Discord stand-in listening on {server.url}")
+
+    if args.serve:
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await server.stop()
+        return
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        bot_setup = BotSetup(
+            "fake-token",
+            api_base_url=server.url,
+            config_file_path=write_fake_config(config_dir),
+        )
+        bot_task = asyncio.create_task(bot_setup.run())
+        try:
+            await asyncio.wait_for(server.ready.wait(), READY_TIMEOUT_SECONDS)
+            started_at = time.perf_counter()
+            await simulate_contest(
+                server,
+                args.rounds,
+                args.message_rate,
+                args.live_scoreboard,
+                args.result_images,
+            )
+            elapsed = time.perf_counter() - started_at
+        finally:
+            await bot_setup.bot.close()
+            await bot_task
+            await server.stop()
+
+    commands_sent = (
+        len(server.users) * (args.rounds + 1)
+        + args.rounds
+        + 2
+        + args.live_scoreboard
+        + args.result_images
+    )
+    print(f"Simulated users: {len(server.users)}, rounds: {args.rounds}")
+    print(f"Commands sent: {commands_sent} in {elapsed:.2f}s")
+    print(server.report.summary())
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,259 @@
+import asyncio
+import itertools
+import json
+import os
+from typing import Any
+
+import discord
+
+from utils.dispatch_filter import DispatchFilter
+
+FAKE_TYPIST_ROLE_NAME = "Typist"
+
+_message_ids = itertools.count(1)
+
+
+def write_fake_config(directory: str) -> str:
+    """Write a throwaway config file for running the cog offline.
+
+    The cog persists the number of contests held, so offline runs point it at
+    this file to keep the real config untouched.
+
+    Args:
+        directory: The directory to write `config.json` into.
+
+    Returns:
+        str: The path of the written config file.
+    """
+    config_file_path = os.path.join(directory, "config.json")
+    with open(config_file_path, "w") as file:
+        json.dump(
+            {
+                "token": "fake-token",
+                "typist_role_name": FAKE_TYPIST_ROLE_NAME,
+                "testing_role_name": FAKE_TYPIST_ROLE_NAME,
+                "contests_held": 0,
+            },
+            file,
+        )
+    return config_file_path
+
+
+class FakeOutbox:
+    """Collects everything the bot would have sent to Discord.
+
+    Attributes:
+        api_latency: Seconds to wait on every simulated API call.
+        calls: The simulated API calls in the order they were made.
+    """
+
+    def __init__(self, api_latency: float = 0.0) -> None:
+        """Initialize the outbox.
+
+        Args:
+            api_latency: Seconds to wait on every simulated API call.
+        """
+        self.api_latency: float = api_latency
+        self.calls: list[tuple[str, Any]] = []
+
+    async def call(self, kind: str, payload: Any = None) -> None:
+        """Record a simulated API call and wait for the configured latency.
+
+        Args:
+            kind: The kind of API call, e.g. `"send"` or `"add_roles"`.
+            payload: The content of the call.
+        """
+        self.calls.append((kind, payload))
+        if self.api_latency:
+            await asyncio.sleep(self.api_latency)
+        else:
+            await asyncio.sleep(0)
+
+
+class FakeRole:
+    """A stand-in for `discord.Role`."""
+
+    def __init__(self, role_id: int, name: str) -> None:
+        self.id: int = role_id
+        self.name: str = name
+        self.mention: str = f"<@&{role_id}>"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FakeRole) and other.id == self.id
+
+    def __hash__(self) -> int:
+        return hash(("role", self.id))
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class FakeMember:
+    """A stand-in for `discord.Member`, compared and hashed by ID."""
+
+    def __init__(self, member_id: int, name: str, outbox: FakeOutbox) -> None:
+        self.id: int = member_id
+        self.name: str = name
+        self.display_name: str = name
+        self.mention: str = f"<@{member_id}>"
+        self.roles: list[FakeRole] = []
+        self.outbox: FakeOutbox = outbox
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FakeMember) and other.id == self.id
+
+    def __hash__(self) -> int:
+        return hash(("member", self.id))
+
+    def __str__(self) -> str:
+        return self.name
+
+    async def add_roles(self, *roles: FakeRole) -> None:
+        await self.outbox.call("add_roles", (self.id, [r.id for r in roles]))
+        self.roles.extend(role for role in roles if role not in self.roles)
+
+    async def remove_roles(self, *roles: FakeRole) -> None:
+        await self.outbox.call("remove_roles", (self.id, [r.id for r in roles]))
+        self.roles = [role for role in self.roles if role not in roles]
+
+
+class FakeGuild:
+    """A stand-in for `discord.Guild` that creates members on demand."""
+
+    def __init__(self, guild_id: int, outbox: FakeOutbox) -> None:
+        self.id: int = guild_id
+        self.outbox: FakeOutbox = outbox
+        self.roles: list[FakeRole] = []
+        self.members_by_id: dict[int, FakeMember] = {}
+
+    @property
+    def members(self) -> list[FakeMember]:
+        return list(self.members_by_id.values())
+
+    def get_member(self, member_id: int) -> FakeMember | None:
+        return self.members_by_id.get(member_id)
+
+    def get_or_create_member(self, member_id: int, name: str) -> FakeMember:
+        member = self.members_by_id.get(member_id)
+        if member is None:
+            member = FakeMember(member_id, name, self.outbox)
+            self.members_by_id[member_id] = member
+        return member
+
+    async def create_role(self, name: str, **kwargs: Any) -> FakeRole:
+        await self.outbox.call("create_role", name)
+        role = FakeRole(len(self.roles) + 1, name)
+        self.roles.append(role)
+        return role
+
+
+class FakeChannel:
+    """A stand-in for `discord.TextChannel`."""
+
+    def __init__(self, channel_id: int, outbox: FakeOutbox) -> None:
+        self.id: int = channel_id
+        self.outbox: FakeOutbox = outbox
+        self.mention: str = f"<#{channel_id}>"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, FakeChannel) and other.id == self.id
+
+    def __hash__(self) -> int:
+        return hash(("channel", self.id))
+
+    async def send(
+        self,
+        content: str | None = None,
+        *,
+        embed: discord.Embed | None = None,
+        file: discord.File | None = None,
+    ) -> "FakeMessage":
+        await self.outbox.call("send", (self.id, content))
+        return FakeMessage(self, None, content)
+
+
+class FakeMessage:
+    """A stand-in for `discord.Message`."""
+
+    def __init__(
+        self,
+        channel: FakeChannel,
+        author: FakeMember | None,
+        content: str | None,
+    ) -> None:
+        self.id: int = next(_message_ids)
+        self.channel: FakeChannel = channel
+        self.author: FakeMember | None = author
+        self.content: str | None = content
+        self.jump_url: str = (
+            f"https://discord.com/channels/0/{channel.id}/{self.id}"
+        )
+
+    async def add_reaction(self, emoji: str) -> None:
+        await self.channel.outbox.call("add_reaction", (self.id, emoji))
+
+    async def edit(self, *, content: str | None = None) -> "FakeMessage":
+        await self.channel.outbox.call("edit", (self.id, content))
+        self.content = content
+        return self
+
+    async def pin(self) -> None:
+        await self.channel.outbox.call("pin", self.id)
+
+    async def unpin(self) -> None:
+        await self.channel.outbox.call("unpin", self.id)
+
+
+class FakeContext:
+    """A stand-in for `commands.Context` with the attributes the cog uses."""
+
+    def __init__(
+        self,
+        guild: FakeGuild,
+        channel: FakeChannel,
+        author: FakeMember,
+        content: str,
+    ) -> None:
+        self.guild: FakeGuild = guild
+        self.channel: FakeChannel = channel
+        self.author: FakeMember = author
+        self.message: FakeMessage = FakeMessage(channel, author, content)
+
+    async def send(
+        self,
+        content: str | None = None,
+        *,
+        embed: discord.Embed | None = None,
+        file: discord.File | None = None,
+    ) -> FakeMessage:
+        return await self.channel.send(content, embed=embed, file=file)
+
+    async def reply(
+        self,
+        content: str | None = None,
+        *,
+        embed: discord.Embed | None = None,
+        file: discord.File | None = None,
+    ) -> FakeMessage:
+        await self.channel.outbox.call("reply", (self.message.id, content))
+        return FakeMessage(self.channel, None, content)
+
+
+class FakeBot:
+    """A stand-in for `commands.Bot` that never connects to Discord."""
+
+    def __init__(self, outbox: FakeOutbox) -> None:
+        self.outbox: FakeOutbox = outbox
+        self.dispatch_filter: DispatchFilter = DispatchFilter("!")
+        self._ready: asyncio.Event = asyncio.Event()
+
+    async def wait_until_ready(self) -> None:
+        # Never ready, so background loops such as the idle check stay idle
+        await self._ready.wait()
+
+    async def is_owner(self, user: FakeMember) -> bool:
+        # Nobody may reload the cog during a replay
+        return False
+
+    async def change_presence(self, **kwargs: Any) -> None:
+        await self.outbox.call("change_presence", None)
@@ -0,0 +1,52 @@
+"""Rebuild every skill rating from the history of rated contests.
+
+Usage:
+    python -m tools.recompute_ratings [--config ./config/config.json]
+
+Run this with the bot stopped after changing the rating formula or its
+constants. The ratings file next to the config file is replaced with the
+ratings obtained by replaying every contest in the history, oldest first.
+"""
+
+import argparse
+import os
+import time
+
+from constants import (
+    CONFIG_JSON_FILE_PATH,
+    RATING_HISTORY_FILE_NAME,
+    RATINGS_JSON_FILE_NAME,
+)
+from utils.rating import RatingBook
+
+
+def parse_args() -> argparse.Namespace:
+    """Parses command-line arguments.
+
+    Returns:
+        argparse.Namespace: A namespace containing the parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Rebuild the skill ratings from the contest history"
+    )
+    parser.add_argument(
+        "--config",
+        default=CONFIG_JSON_FILE_PATH,
+        help="Path of the JSON config file the ratings are stored next to",
+    )
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    config_dir = os.path.dirname(args.config)
+    ratings = RatingBook(
+        os.path.join(config_dir, RATINGS_JSON_FILE_NAME),
+        os.path.join(config_dir, RATING_HISTORY_FILE_NAME),
+    )
+    started_at = time.perf_counter()
+    contest_count = ratings.recompute()
+    elapsed = time.perf_counter() - started_at
+    print(f"Contests replayed: {contest_count}")
+    print(f"Typists rated: {len(ratings.ratings)}")
+    print(f"Elapsed: {elapsed:.3f}s")
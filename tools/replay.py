@@ -0,0 +1,312 @@
+"""Replay a command trace recorded with `python main.py --trace PATH`.
+
+Usage:
+    python -m tools.replay trace.jsonl [--speed 1] [--api-latency 0.05]
+
+The trace is fed to a `TypingContestBot` backed by fake Discord objects, so
+nothing is sent over the network. Every command is dispatched as its own task,
+as `discord.py` does for incoming messages, either at the recorded pace scaled
+by `--speed` or, by default, as fast as possible.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+from typing import Any
+
+from discord.ext import commands
+
+from cogs.typing_contest import TypingContestBot
+from contest_state import ContestState
+from tools.fakes import (
+    FAKE_TYPIST_ROLE_NAME,
+    FakeBot,
+    FakeChannel,
+    FakeContext,
+    FakeGuild,
+    FakeOutbox,
+    write_fake_config,
+)
+from utils.trace import TraceRecorder, load_trace
+
+REPLAY_GUILD_ID = 0
+
+
+def parse_args() -> argparse.Namespace:
+    """Parses command-line arguments.
+
+    Returns:
+        argparse.Namespace: A namespace containing the parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Replay a command trace")
+    parser.add_argument("trace", help="Path of the JSONL trace file")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0,
+        help="Replay speed relative to the recording, e.g. 1 for real time. "
+        "0 (the default) replays as fast as possible.",
+    )
+    parser.add_argument(
+        "--api-latency",
+        type=float,
+        default=0.0,
+        help="Seconds each simulated Discord API call takes",
+    )
+    return parser.parse_args()
+
+
+class TraceReplayer:
+    """Feeds a recorded trace to a `TypingContestBot` with fake contexts.
+
+    Attributes:
+        records: The command records to replay.
+        speed: The replay speed, or 0 to replay as fast as possible.
+        outbox: Collects the simulated API calls made by the cog.
+        guild: The fake guild every command is issued in.
+        channels: The fake channels by ID.
+        latencies: The time each command took to complete, in seconds.
+        errors: The number of commands that raised an exception.
+        commands_by_name: The cog's commands, subcommands included, by
+            qualified name.
+    """
+
+    def __init__(
+        self, records: list[dict], speed: float, api_latency: float
+    ) -> None:
+        """Initialize the replayer.
+
+        Args:
+            records: The command records to replay.
+            speed: The replay speed, or 0 to replay as fast as possible.
+            api_latency: Seconds each simulated Discord API call takes.
+        """
+        self.records: list[dict] = records
+        self.speed: float = speed
+        self.outbox: FakeOutbox = FakeOutbox(api_latency)
+        self.guild: FakeGuild = FakeGuild(REPLAY_GUILD_ID, self.outbox)
+        self.channels: dict[int, FakeChannel] = {}
+        self.latencies: list[float] = []
+        self.errors: int = 0
+        self.commands_by_name: dict[str, commands.Command] = {}
+
+    def build_context(self, record: dict) -> FakeContext:
+        """Build the fake context for a command record.
+
+        Args:
+            record: The command record.
+
+        Returns:
+            FakeContext: The context the command is invoked with.
+        """
+        channel = self.get_channel(record["contest"])
+        author = self.guild.get_or_create_member(
+            record["author"], record.get("author_name", str(record["author"]))
+        )
+        content = " ".join(
+            ["!" + record["command"]]
+            + [
+                self.argument_text(arg)
+                for arg in record["args"]
+                if arg is not None
+            ]
+        )
+        return FakeContext(self.guild, channel, author, content)
+
+    def get_channel(self, channel_id: int) -> FakeChannel:
+        """Return the fake channel with an ID, creating it if needed.
+
+        Args:
+            channel_id: The channel ID.
+
+        Returns:
+            FakeChannel: The channel.
+        """
+        channel = self.channels.get(channel_id)
+        if channel is None:
+            channel = self.channels[channel_id] = FakeChannel(
+                channel_id, self.outbox
+            )
+        return channel
+
+    def argument_text(self, arg: Any) -> str:
+        """Return how a recorded argument was written in the command.
+
+        Args:
+            arg: The recorded argument.
+
+        Returns:
+            str: The argument as text.
+        """
+        if isinstance(arg, list):
+            return " ".join(self.argument_text(item) for item in arg)
+        if isinstance(arg, dict):
+            if "channel" in arg:
+                return f"<#{arg['channel']}>"
+            return arg["name"]
+        return str(arg)
+
+    def build_argument(self, arg: Any) -> Any:
+        """Map a recorded argument back onto fake objects.
+
+        Args:
+            arg: The recorded argument.
+
+        Returns:
+            Any: The argument to pass to the command callback. Omitted
+            optional arguments are recorded as null and passed as None.
+        """
+        if isinstance(arg, list):
+            return [self.build_argument(item) for item in arg]
+        if isinstance(arg, dict):
+            if "channel" in arg:
+                return self.get_channel(arg["channel"])
+            return self.guild.get_or_create_member(arg["member"], arg["name"])
+        return arg
+
+    def build_arguments(self, record: dict) -> list:
+        """Map the recorded arguments back onto fake objects.
+
+        Args:
+            record: The command record.
+
+        Returns:
+            list: The arguments to pass to the command callback.
+        """
+        return [self.build_argument(arg) for arg in record["args"]]
+
+    async def dispatch(self, cog: TypingContestBot, record: dict) -> None:
+        """Invoke a single recorded command and measure its latency.
+
+        Args:
+            cog: The cog under test.
+            record: The command record.
+        """
+        started_at = time.perf_counter()
+        try:
+            command = self.commands_by_name[record["command"]]
+            ctx = self.build_context(record)
+            arguments = self.build_arguments(record)
+            await command.callback(cog, ctx, *arguments)
+        except Exception as error:
+            self.errors += 1
+            print(f"{record['command']} raised {error!r}")
+        self.latencies.append(time.perf_counter() - started_at)
+
+    async def run(self, cog: TypingContestBot) -> float:
+        """Replay every record against the cog.
+
+        Args:
+            cog: The cog under test.
+
+        Returns:
+            float: The wall-clock time the replay took, in seconds.
+        """
+        self.commands_by_name = {
+            command.qualified_name: command for command in cog.walk_commands()
+        }
+        tasks = []
+        started_at = time.perf_counter()
+        first_timestamp = self.records[0]["timestamp"] if self.records else 0
+        for record in self.records:
+            if self.speed:
+                offset = (record["timestamp"] - first_timestamp) / self.speed
+                delay = offset - (time.perf_counter() - started_at)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(self.dispatch(cog, record)))
+            # Let the new task start before the next message "arrives"
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - started_at
+
+
+async def replay(trace_path: str, speed: float, api_latency: float) -> bool:
+    """Replay a trace and print throughput, latency and the result checks.
+
+    The final result rows of every contest that ended are compared with the
+    recorded ones, and the state of the contests still running at the end
+    with the recorded state.
+
+    Args:
+        trace_path: The path of the trace file.
+        speed: The replay speed, or 0 to replay as fast as possible.
+        api_latency: Seconds each simulated Discord API call takes.
+
+    Returns:
+        bool: False if any result or the final state differs from the
+        recording.
+    """
+    records, expected_results, expected_state = load_trace(trace_path)
+    replayer = TraceReplayer(records, speed, api_latency)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        config_file_path = write_fake_config(config_dir)
+        await replayer.guild.create_role(FAKE_TYPIST_ROLE_NAME)
+
+        # Commands are invoked directly, so only the results are recorded
+        result_trace_path = os.path.join(config_dir, "results.jsonl")
+        cog = TypingContestBot(
+            FakeBot(replayer.outbox),
+            ContestState(
+                False,
+                TraceRecorder(result_trace_path),
+                config_file_path=config_file_path,
+            ),
+        )
+        try:
+            elapsed = await replayer.run(cog)
+        finally:
+            cog.check_idle_status.cancel()
+            cog.state.trace_recorder.close()
+        final_state = cog.snapshot_state()
+        _, results, _ = load_trace(result_trace_path)
+
+    latencies = sorted(replayer.latencies) or [0.0]
+    print(f"Commands replayed: {len(records)} ({replayer.errors} errors)")
+    print(f"API calls simulated: {len(replayer.outbox.calls)}")
+    print(f"Elapsed: {elapsed:.3f}s")
+    print(
+        f"Throughput: {len(records) / elapsed if elapsed else 0:.1f} commands/s"
+    )
+    print(
+        "Latency: "
+        f"mean {statistics.fmean(latencies) * 1000:.2f}ms, "
+        f"p50 {latencies[len(latencies) // 2] * 1000:.2f}ms, "
+        f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.2f}ms, "
+        f"max {latencies[-1] * 1000:.2f}ms"
+    )
+
+    matches = True
+    contest_count = sum(len(rows) for rows in expected_results.values())
+    if not expected_results and expected_state is None:
+        # Traces recorded before results were have neither record
+        print("Contest results: not checked (the trace has no result record)")
+    elif results == expected_results:
+        print(f"Contest results: {contest_count} match the recording")
+    else:
+        matches = False
+        print("Contest results: DIFFER from the recording")
+        print(f"  expected: {json.dumps(expected_results, sort_keys=True)}")
+        print(f"  replayed: {json.dumps(results, sort_keys=True)}")
+
+    if expected_state is None:
+        print("Final state: not checked (the trace has no state record)")
+    elif final_state == expected_state:
+        print("Final state: matches the recording")
+    else:
+        matches = False
+        print("Final state: DIFFERS from the recording")
+        print(f"  expected: {json.dumps(expected_state, sort_keys=True)}")
+        print(f"  replayed: {json.dumps(final_state, sort_keys=True)}")
+    return matches
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    matches = asyncio.run(replay(args.trace, args.speed, args.api_latency))
+    raise SystemExit(0 if matches else 1)
@@ -0,0 +1,258 @@
+import discord
+
+from constants import (
+    ALREADY_REGISTERED,
+    NOT_REGISTERED,
+    TOURNAMENT_NOT_ENOUGH_REGISTRANTS,
+)
+from contest import Contest, ContestError
+from utils.running_stats import RunningStats
+
+STAGE_REGISTRATION = "registration"
+STAGE_HEATS = "heats"
+STAGE_FINAL = "final"
+
+
+class Tournament:
+    """A tournament whose heats run as parallel contests in separate channels.
+
+    Registrants sign up in the tournament channel and are split into heats,
+    one per heat channel. Every heat is an ordinary `Contest` played with the
+    usual `!next`, `!wpm` and `!end` flow. The best typists of each heat by
+    average WPM qualify for a final contest in the tournament channel, and
+    the final and heat results are merged into one overall leaderboard.
+
+    Unlike a `Contest`, the tournament is not an actor: every change to it is
+    a single synchronous step taken by the creator's commands, with no
+    `await` in between, so it never interleaves with another change.
+
+    Attributes:
+        creator: The user who started the tournament.
+        channel: The channel where registration and the final take place.
+        heat_channels: The channels the heats are played in.
+        stage: The current stage, one of `STAGE_REGISTRATION`, `STAGE_HEATS`
+            and `STAGE_FINAL`.
+        registrants: The registered typists, in registration order.
+        heats: The heat contests by channel ID.
+        heat_averages: The average WPM of every qualified typist of each
+            finished heat, by channel ID.
+        final: The final contest, once it has started.
+        typist_stats: The running statistics of every typist's accepted WPMs
+            by ID, shared with the heats and the final.
+    """
+
+    def __init__(
+        self,
+        creator: discord.Member,
+        channel: discord.TextChannel,
+        heat_channels: list[discord.TextChannel],
+        typist_stats: dict[int, RunningStats] | None = None,
+    ) -> None:
+        """Initialize the tournament in its registration stage.
+
+        Args:
+            creator: The user who started the tournament.
+            channel: The channel where registration and the final take place.
+            heat_channels: The channels the heats are played in.
+            typist_stats: The running statistics of every typist's accepted
+                WPMs by ID, kept across contests. Defaults to a history of
+                this tournament only.
+        """
+        self.creator: discord.Member = creator
+        self.channel: discord.TextChannel = channel
+        self.heat_channels: list[discord.TextChannel] = heat_channels
+        self.stage: str = STAGE_REGISTRATION
+        self.registrants: list[discord.Member] = []
+        self.heats: dict[int, Contest] = {}
+        self.heat_averages: dict[int, dict[discord.Member, float]] = {}
+        self.final: Contest | None = None
+        self.typist_stats: dict[int, RunningStats] = (
+            typist_stats if typist_stats is not None else {}
+        )
+
+    def register(self, member: discord.Member) -> None:
+        """Register a typist for the tournament.
+
+        Args:
+            member: The member registering.
+
+        Raises:
+            ContestError: If the member is already registered.
+        """
+        if member in self.registrants:
+            raise ContestError(ALREADY_REGISTERED)
+        self.registrants.append(member)
+
+    def unregister(self, member: discord.Member) -> None:
+        """Withdraw a typist's registration.
+
+        Args:
+            member: The member withdrawing.
+
+        Raises:
+            ContestError: If the member is not registered.
+        """
+        if member not in self.registrants:
+            raise ContestError(NOT_REGISTERED)
+        self.registrants.remove(member)
+
+    def holds(self, contest: Contest) -> bool:
+        """Check whether a contest is one of the heats or the final.
+
+        Args:
+            contest: The contest to check.
+
+        Returns:
+            bool: True if the contest belongs to this tournament.
+        """
+        return contest is self.final or any(
+            contest is heat for heat in self.heats.values()
+        )
+
+    def split_into_heats(
+        self, registrants: list[discord.Member] | None = None
+    ) -> list[Contest]:
+        """Split the registrants into heats and create a contest for each.
+
+        Registrants are dealt out in snake order, one to each heat in turn and
+        then back in reverse, so heat sizes differ by at most one. When the
+        list is ordered by strength, the heat that gets the stronger typist of
+        one pass gets the weaker of the next, so no heat is stronger
+        throughout.
+
+        Args:
+            registrants: The registrants in the order to deal them out.
+                Defaults to registration order.
+
+        Returns:
+            list[Contest]: The heat contests, already populated.
+
+        Raises:
+            ContestError: If there are fewer registrants than heats.
+        """
+        registrants = registrants or self.registrants
+        heat_count = len(self.heat_channels)
+        if len(registrants) < heat_count:
+            raise ContestError(
+                TOURNAMENT_NOT_ENOUGH_REGISTRANTS.format(heats=heat_count)
+            )
+
+        heat_members = [[] for _ in self.heat_channels]
+        for position, member in enumerate(registrants):
+            heat_pass, index = divmod(position, heat_count)
+            if heat_pass % 2:
+                index = heat_count - 1 - index
+            heat_members[index].append(member)
+
+        for heat_channel, members in zip(
+            self.heat_channels, heat_members, strict=True
+        ):
+            heat = Contest(self.creator, heat_channel, self.typist_stats)
+            # The heat is not visible to any command yet, so it can be
+            # populated directly instead of through its queue
+            for member in members:
+                heat.join(member)
+            self.heats[heat_channel.id] = heat
+
+        self.stage = STAGE_HEATS
+        return list(self.heats.values())
+
+    def record_heat(self, heat: Contest) -> bool:
+        """Record the results of a finished heat.
+
+        Args:
+            heat: The finished heat contest.
+
+        Returns:
+            bool: True if every heat has now finished.
+        """
+        self.heat_averages[heat.channel.id] = dict(heat.participant_averages)
+        return len(self.heat_averages) == len(self.heats)
+
+    def qualifiers(self, per_heat: int) -> list[discord.Member]:
+        """Return the best typists of every finished heat.
+
+        Args:
+            per_heat: How many typists qualify from each heat.
+
+        Returns:
+            list[discord.Member]: The qualifiers, heat by heat.
+        """
+        qualified = []
+        for averages in self.heat_averages.values():
+            ranked = sorted(averages.items(), key=lambda x: x[1], reverse=True)
+            qualified.extend(member for member, _ in ranked[:per_heat])
+        return qualified
+
+    def start_final(self, per_heat: int) -> Contest:
+        """Create the final contest with the qualifiers of every heat.
+
+        Args:
+            per_heat: How many typists qualify from each heat.
+
+        Returns:
+            Contest: The final contest, already populated.
+        """
+        self.final = Contest(self.creator, self.channel, self.typist_stats)
+        for member in self.qualifiers(per_heat):
+            self.final.join(member)
+        self.stage = STAGE_FINAL
+        return self.final
+
+    def leaderboard(self) -> list[tuple[discord.Member, str, float]]:
+        """Merge the final and heat results into one overall leaderboard.
+
+        Finalists are ranked by their average WPM in the final. Everyone else
+        with a valid heat result follows, ranked by their heat average; this
+        includes finalists who did not qualify in the final.
+
+        Returns:
+            list[tuple[discord.Member, str, float]]: Each typist with the
+            stage their ranking comes from and their average WPM, best first.
+        """
+        ranked: list[tuple[discord.Member, str, float]] = []
+        finalists: set[discord.Member] = set()
+        if self.final is not None:
+            finalists = set(self.final.participant_averages)
+            ranked.extend(
+                (member, STAGE_FINAL, average)
+                for member, average in sorted(
+                    self.final.participant_averages.items(),
+                    key=lambda x: x[1],
+                    reverse=True,
+                )
+            )
+
+        heat_ranked = sorted(
+            (
+                (member, STAGE_HEATS, average)
+                for averages in self.heat_averages.values()
+                for member, average in averages.items()
+                if member not in finalists
+            ),
+            key=lambda x: x[2],
+            reverse=True,
+        )
+        ranked.extend(heat_ranked)
+        return ranked
+
+    def snapshot(self) -> dict:
+        """Return a JSON-compatible snapshot of the tournament state.
+
+        Returns:
+            dict: The snapshot of the tournament state.
+        """
+        return {
+            "creator": self.creator.id,
+            "channel": self.channel.id,
+            "heat_channels": [channel.id for channel in self.heat_channels],
+            "stage": self.stage,
+            "registrants": [member.id for member in self.registrants],
+            "heat_averages": {
+                str(channel_id): {
+                    str(member.id): average
+                    for member, average in averages.items()
+                }
+                for channel_id, averages in self.heat_averages.items()
+            },
+        }
@@ -0,0 +1,215 @@
+import time
+
+import discord
+
+from constants import (
+    ADMISSION_PRUNE_INTERVAL_SECONDS,
+    ADMISSION_REPLY_COOLDOWN_SECONDS,
+    CHANNEL_COMMAND_BURST,
+    CHANNEL_COMMAND_RATE,
+    CHANNEL_THROTTLED,
+    GUILD_COMMAND_BURST,
+    GUILD_COMMAND_RATE,
+    USER_COMMAND_BURST,
+    USER_COMMAND_RATE,
+    USER_THROTTLED,
+)
+
+
+class TokenBucket:
+    """A token bucket that refills continuously up to its capacity.
+
+    Attributes:
+        rate: The tokens added per second.
+        capacity: The most tokens the bucket holds, i.e. the allowed burst.
+        tokens: The tokens currently available.
+        updated_at: When the tokens were last refilled, from
+            `time.monotonic`.
+    """
+
+    def __init__(self, rate: float, capacity: float, now: float) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: The tokens added per second.
+            capacity: The most tokens the bucket holds.
+            now: The current time, from `time.monotonic`.
+        """
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self.tokens: float = capacity
+        self.updated_at: float = now
+
+    def refill(self, now: float) -> None:
+        """Add the tokens earned since the last refill.
+
+        Args:
+            now: The current time, from `time.monotonic`.
+        """
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    @property
+    def full(self) -> bool:
+        """Whether the bucket is at capacity, so it can be forgotten."""
+        return self.tokens >= self.capacity
+
+
+class AdmissionControl:
+    """Token buckets per user, per channel and per guild in front of commands.
+
+    A command is admitted only if its user, channel and guild buckets all
+    have a token left, and then takes one from each. The user bucket stops a
+    single user from spamming, while the larger channel and guild buckets
+    only kick in for floods well beyond the traffic of a big contest.
+    Contest creators are never throttled, since they drive their contest
+    and may legitimately send several commands in a row.
+
+    Rejected commands are dropped. The first one per user or channel every
+    `ADMISSION_REPLY_COOLDOWN_SECONDS` gets a shared reply explaining why,
+    so a flood costs at most one outgoing message per scope instead of one
+    per command.
+
+    Attributes:
+        user_buckets: The bucket of each user by ID.
+        channel_buckets: The bucket of each channel by ID.
+        guild_buckets: The bucket of each guild by ID.
+        replied_at: When each user or channel last got a shared reply, by
+            scope and ID, from `time.monotonic`.
+        pruned_at: When idle buckets were last forgotten, from
+            `time.monotonic`.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the admission control with no buckets."""
+        self.user_buckets: dict[int, TokenBucket] = {}
+        self.channel_buckets: dict[int, TokenBucket] = {}
+        self.guild_buckets: dict[int, TokenBucket] = {}
+        self.replied_at: dict[tuple[str, int], float] = {}
+        self.pruned_at: float = time.monotonic()
+
+    def admit(
+        self, message: discord.Message, exempt: bool = False
+    ) -> tuple[bool, str | None]:
+        """Decide whether a command message may be processed.
+
+        Args:
+            message: The command message.
+            exempt: If true, the command is admitted without touching any
+                bucket. Used for contest creators, so neither their own pace
+                nor a flood ever locks them out of their contest.
+
+        Returns:
+            tuple[bool, str | None]: Whether the command is admitted and, if
+            it is not, the shared reply to send, or None if one was sent
+            recently.
+        """
+        now = time.monotonic()
+        if now - self.pruned_at > ADMISSION_PRUNE_INTERVAL_SECONDS:
+            self.prune(now)
+
+        if exempt:
+            return True, None
+
+        checks = [
+            (
+                "user",
+                message.author.id,
+                self.user_buckets,
+                USER_COMMAND_RATE,
+                USER_COMMAND_BURST,
+            ),
+            (
+                "channel",
+                message.channel.id,
+                self.channel_buckets,
+                CHANNEL_COMMAND_RATE,
+                CHANNEL_COMMAND_BURST,
+            ),
+        ]
+        if message.guild is not None:
+            checks.append(
+                (
+                    "guild",
+                    message.guild.id,
+                    self.guild_buckets,
+                    GUILD_COMMAND_RATE,
+                    GUILD_COMMAND_BURST,
+                )
+            )
+
+        buckets = []
+        for scope, key, scope_buckets, rate, capacity in checks:
+            bucket = scope_buckets.get(key)
+            if bucket is None:
+                bucket = scope_buckets[key] = TokenBucket(rate, capacity, now)
+            else:
+                bucket.refill(now)
+            if bucket.tokens < 1:
+                return False, self.shared_reply(scope, message, now)
+            buckets.append(bucket)
+
+        for bucket in buckets:
+            bucket.tokens -= 1
+        return True, None
+
+    def shared_reply(
+        self, scope: str, message: discord.Message, now: float
+    ) -> str | None:
+        """Return the reply to a rejected command, if one is due.
+
+        A throttled guild is answered per channel, so the users in each
+        channel learn why their commands are ignored.
+
+        Args:
+            scope: The scope whose bucket ran out, "user", "channel" or
+                "guild".
+            message: The rejected command message.
+            now: The current time, from `time.monotonic`.
+
+        Returns:
+            str | None: The reply, or None if the scope was answered less than
+            `ADMISSION_REPLY_COOLDOWN_SECONDS` ago.
+        """
+        if scope == "user":
+            key = ("user", message.author.id)
+            reply = USER_THROTTLED.format(user=message.author.mention)
+        else:
+            key = ("channel", message.channel.id)
+            reply = CHANNEL_THROTTLED
+
+        replied_at = self.replied_at.get(key)
+        if (
+            replied_at is not None
+            and now - replied_at < ADMISSION_REPLY_COOLDOWN_SECONDS
+        ):
+            return None
+        self.replied_at[key] = now
+        return reply
+
+    def prune(self, now: float) -> None:
+        """Forget the buckets that have refilled and the expired cooldowns.
+
+        A full bucket behaves exactly like a new one, so forgetting it keeps
+        memory proportional to the recently active users.
+
+        Args:
+            now: The current time, from `time.monotonic`.
+        """
+        for scope_buckets in (
+            self.user_buckets,
+            self.channel_buckets,
+            self.guild_buckets,
+        ):
+            for key, bucket in list(scope_buckets.items()):
+                bucket.refill(now)
+                if bucket.full:
+                    del scope_buckets[key]
+        self.replied_at = {
+            key: replied_at
+            for key, replied_at in self.replied_at.items()
+            if now - replied_at < ADMISSION_REPLY_COOLDOWN_SECONDS
+        }
+        self.pruned_at = now
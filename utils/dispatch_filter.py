@@ -0,0 +1,134 @@
+import time
+
+import discord
+from discord.ext import commands
+
+from constants import NO_ACTIVE_CONTEST_REPLY_COOLDOWN_SECONDS
+
+
+class DispatchFilter:
+    """Cheap gate that drops irrelevant messages before command dispatch.
+
+    `commands.Bot` builds a full context, parses the prefix and looks up the
+    command for every message it sees. This filter decides with a few string
+    and set operations whether a message can lead to anything useful, so that
+    chatter, unknown commands and contest commands sent outside the contest
+    channel are dropped before any of that happens.
+
+    Commands marked with `extras={"contest_channel_only": True}` are only let
+    through in an active contest channel. When no contest is active at all,
+    one of them is let through per channel every
+    `NO_ACTIVE_CONTEST_REPLY_COOLDOWN_SECONDS` so the user still learns why
+    nothing happened, and the rest are dropped.
+
+    Attributes:
+        prefix: The command prefix.
+        contest_channel_ids: The IDs of the channels with an active contest.
+        command_table: Whether each command name or alias is contest-only.
+        no_contest_replied_at: When each channel was last let through to get
+            a `NO_ACTIVE_CONTEST` reply, from `time.monotonic`.
+        pruned_at: When expired cooldowns were last forgotten, from
+            `time.monotonic`.
+    """
+
+    def __init__(self, prefix: str) -> None:
+        """Initialize the filter.
+
+        Args:
+            prefix: The command prefix.
+        """
+        self.prefix: str = prefix
+        self.contest_channel_ids: set[int] = set()
+        self.command_table: dict[str, bool] = {}
+        self.no_contest_replied_at: dict[int, float] = {}
+        self.pruned_at: float = time.monotonic()
+
+    def compile_commands(self, bot_commands: set[commands.Command]) -> None:
+        """Precompile the command table from the bot's commands.
+
+        This must be called again whenever commands are added or removed.
+
+        Args:
+            bot_commands: The bot's top-level commands.
+        """
+        command_table = {}
+        for command in bot_commands:
+            contest_only = command.extras.get("contest_channel_only", False)
+            for name in (command.name, *command.aliases):
+                command_table[name] = contest_only
+        self.command_table = command_table
+
+    def add_contest_channel(self, channel_id: int) -> None:
+        """Mark a channel as holding an active contest.
+
+        Args:
+            channel_id: The ID of the contest channel.
+        """
+        self.contest_channel_ids.add(channel_id)
+        self.no_contest_replied_at.clear()
+
+    def remove_contest_channel(self, channel_id: int) -> None:
+        """Mark a channel as no longer holding an active contest.
+
+        Args:
+            channel_id: The ID of the contest channel.
+        """
+        self.contest_channel_ids.discard(channel_id)
+
+    def should_dispatch(self, message: discord.Message) -> bool:
+        """Decide whether a message is worth dispatching as a command.
+
+        Args:
+            message: The incoming message.
+
+        Returns:
+            bool: True if the message should be processed as a command.
+        """
+        content = message.content
+        if not content.startswith(self.prefix):
+            return False
+
+        invoked_with = content[len(self.prefix) :].split(maxsplit=1)
+        if not invoked_with:
+            return False
+
+        contest_only = self.command_table.get(invoked_with[0])
+        if contest_only is None:
+            return False
+        if not contest_only:
+            return True
+
+        channel_id = message.channel.id
+        if channel_id in self.contest_channel_ids:
+            return True
+        if self.contest_channel_ids:
+            # A contest is active elsewhere, the cog would ignore it anyway
+            return False
+
+        now = time.monotonic()
+        if now - self.pruned_at > NO_ACTIVE_CONTEST_REPLY_COOLDOWN_SECONDS:
+            self.prune(now)
+        replied_at = self.no_contest_replied_at.get(channel_id)
+        if (
+            replied_at is not None
+            and now - replied_at < NO_ACTIVE_CONTEST_REPLY_COOLDOWN_SECONDS
+        ):
+            return False
+        self.no_contest_replied_at[channel_id] = now
+        return True
+
+    def prune(self, now: float) -> None:
+        """Forget the expired cooldowns.
+
+        An expired cooldown behaves exactly like none, so forgetting it keeps
+        memory proportional to the recently active channels.
+
+        Args:
+            now: The current time, from `time.monotonic`.
+        """
+        self.no_contest_replied_at = {
+            channel_id: replied_at
+            for channel_id, replied_at in self.no_contest_replied_at.items()
+            if now - replied_at < NO_ACTIVE_CONTEST_REPLY_COOLDOWN_SECONDS
+        }
+        self.pruned_at = now
@@ -0,0 +1,244 @@
+import re
+from collections import Counter
+from typing import Annotated
+
+import discord
+from discord.ext import commands
+
+from constants import AMBIGUOUS_MEMBER, AMBIGUOUS_MEMBER_SHOWN
+
+MENTION_OR_ID = re.compile(r"<@!?([0-9]{15,20})>|([0-9]{15,20})")
+
+
+class AmbiguousMember(commands.BadArgument):
+    """Raised when a member argument matches several indexed members.
+
+    Attributes:
+        argument: The member argument.
+        matches: The members it matches.
+    """
+
+    def __init__(self, argument: str, matches: list[discord.Member]) -> None:
+        """Initialize the error.
+
+        Args:
+            argument: The member argument.
+            matches: The members it matches.
+        """
+        self.argument: str = argument
+        self.matches: list[discord.Member] = matches
+        members = ", ".join(
+            member.mention for member in matches[:AMBIGUOUS_MEMBER_SHOWN]
+        )
+        if len(matches) > AMBIGUOUS_MEMBER_SHOWN:
+            members += f" and {len(matches) - AMBIGUOUS_MEMBER_SHOWN} more"
+        super().__init__(
+            AMBIGUOUS_MEMBER.format(argument=argument, members=members)
+        )
+
+
+class TrieNode:
+    """A node of a `PrefixTrie`.
+
+    Attributes:
+        children: The child nodes by character.
+        members: How many indexed keys under this node belong to each member.
+        exact: How many indexed keys ending at this node belong to each
+            member.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty node."""
+        self.children: dict[str, TrieNode] = {}
+        self.members: Counter[discord.Member] = Counter()
+        self.exact: Counter[discord.Member] = Counter()
+
+
+class PrefixTrie:
+    """Finds the members with a key starting with a given prefix.
+
+    Every node counts the members of the keys below it, so a lookup walks
+    the prefix once and never visits the keys that match it. A member may be
+    indexed under several keys, so the counts let one key be removed without
+    losing the member's other keys.
+
+    Attributes:
+        root: The node of the empty prefix.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty trie."""
+        self.root: TrieNode = TrieNode()
+
+    def insert(self, key: str, member: discord.Member) -> None:
+        """Index a member under a key.
+
+        Args:
+            key: The key.
+            member: The member.
+        """
+        node = self.root
+        for character in key:
+            node = node.children.setdefault(character, TrieNode())
+            node.members[member] += 1
+        node.exact[member] += 1
+
+    def remove(self, key: str, member: discord.Member) -> None:
+        """Remove a member indexed under a key.
+
+        Args:
+            key: The key the member was indexed under.
+            member: The member.
+        """
+        path = [self.root]
+        for character in key:
+            node = path[-1].children.get(character)
+            if node is None:
+                return
+            path.append(node)
+        if path[-1].exact[member] <= 1:
+            del path[-1].exact[member]
+        else:
+            path[-1].exact[member] -= 1
+        for depth in range(len(key), 0, -1):
+            node = path[depth]
+            if node.members[member] <= 1:
+                del node.members[member]
+            else:
+                node.members[member] -= 1
+            if not node.members:
+                del path[depth - 1].children[key[depth - 1]]
+
+    def find(self, prefix: str) -> list[discord.Member]:
+        """Return the members with a key starting with a prefix.
+
+        Args:
+            prefix: The prefix.
+
+        Returns:
+            list[discord.Member]: The members whose key is exactly the
+            prefix, if any; otherwise every member with a key starting with
+            it.
+        """
+        node = self.root
+        for character in prefix:
+            node = node.children.get(character)
+            if node is None:
+                return []
+        return list(node.exact or node.members)
+
+
+class MemberIndex:
+    """Resolves member arguments against a small set of members.
+
+    Members are found by ID or mention, by exact user or display name, or
+    by a case-insensitive prefix of either name, each in time proportional
+    to the length of the argument rather than to the number of members.
+
+    Names are indexed as they were when the member was added.
+
+    Attributes:
+        by_id: The indexed members by ID.
+        by_name: The indexed members by exact user and display name.
+        prefixes: The indexed members by their case-folded names.
+        names: The names each member is indexed under, by ID.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.by_id: dict[int, discord.Member] = {}
+        self.by_name: dict[str, set[discord.Member]] = {}
+        self.prefixes: PrefixTrie = PrefixTrie()
+        self.names: dict[int, set[str]] = {}
+
+    def add(self, member: discord.Member) -> None:
+        """Index a member, if it is not indexed yet.
+
+        Args:
+            member: The member.
+        """
+        if member.id in self.by_id:
+            return
+        names = {member.name, member.display_name}
+        self.by_id[member.id] = member
+        self.names[member.id] = names
+        for name in names:
+            self.by_name.setdefault(name, set()).add(member)
+        for key in {name.casefold() for name in names}:
+            self.prefixes.insert(key, member)
+
+    def discard(self, member: discord.Member) -> None:
+        """Remove a member from the index, if it is indexed.
+
+        Args:
+            member: The member.
+        """
+        names = self.names.pop(member.id, None)
+        if names is None:
+            return
+        member = self.by_id.pop(member.id)
+        for name in names:
+            self.by_name[name].discard(member)
+            if not self.by_name[name]:
+                del self.by_name[name]
+        for key in {name.casefold() for name in names}:
+            self.prefixes.remove(key, member)
+
+    def resolve(self, argument: str) -> list[discord.Member]:
+        """Return the indexed members a member argument may refer to.
+
+        Args:
+            argument: A mention, an ID, a name or a name prefix.
+
+        Returns:
+            list[discord.Member]: The member with the mentioned ID, else the
+            members with the exact name, else the members with a name
+            starting with the argument, ignoring case. Empty if none match.
+        """
+        match = MENTION_OR_ID.fullmatch(argument)
+        if match is not None:
+            member = self.by_id.get(int(match.group(1) or match.group(2)))
+            return [member] if member is not None else []
+
+        exact = self.by_name.get(argument)
+        if exact:
+            return list(exact)
+        return self.prefixes.find(argument.casefold())
+
+
+class ContestMemberConverter(commands.Converter):
+    """Converts a member argument using the index of the channel's contest.
+
+    The participants and banned users of the contest are resolved from its
+    `MemberIndex`. Arguments matching several of them are rejected with
+    `AmbiguousMember`, and only arguments matching none are passed on to
+    `commands.MemberConverter`, which may fetch the member from the API.
+    """
+
+    async def convert(self, ctx, argument: str) -> discord.Member:
+        """Convert a member argument.
+
+        Args:
+            ctx: The command context.
+            argument: The member argument.
+
+        Returns:
+            discord.Member: The member the argument refers to.
+
+        Raises:
+            AmbiguousMember: If the argument matches several members of the
+                contest.
+            commands.MemberNotFound: If no member matches the argument.
+        """
+        contest = ctx.cog.state.contests.get(ctx.channel.id)
+        if contest is not None:
+            matches = contest.member_index.resolve(argument)
+            if len(matches) == 1:
+                return matches[0]
+            if matches:
+                raise AmbiguousMember(argument, matches)
+        return await commands.MemberConverter().convert(ctx, argument)
+
+
+# A member command argument resolved with `ContestMemberConverter`
+ContestMember = Annotated[discord.Member, ContestMemberConverter]
@@ -0,0 +1,212 @@
+import bisect
+import json
+import os
+from datetime import datetime
+
+from constants import (
+    RATING_INITIAL,
+    RATING_K_FACTOR,
+    RATING_PROVISIONAL_CONTESTS,
+    RATING_PROVISIONAL_K_FACTOR,
+)
+
+
+def expected_score(rating: float, opponent_rating: float) -> float:
+    """Return the Elo expected score of a typist against an opponent.
+
+    Args:
+        rating: The typist's rating.
+        opponent_rating: The opponent's rating.
+
+    Returns:
+        float: The expected score, between 0 for a certain loss and 1 for a
+        certain win.
+    """
+    return 1 / (1 + 10 ** ((opponent_rating - rating) / 400))
+
+
+def rate_contest(
+    ratings: dict[int, float],
+    contests: dict[int, int],
+    averages: dict[int, float],
+) -> dict[int, float]:
+    """Update the ratings with the results of one contest, in place.
+
+    This is a multi-player Elo update. Each typist's actual score is the
+    share of the other typists they beat by average WPM, ties counting half,
+    and their expected score is taken against the mean rating of the field.
+    That keeps the update at O(n log n) for n typists, for the sort, instead
+    of comparing every pair. All typists are rated from their ratings before
+    the contest, so the order they are listed in does not matter.
+
+    Args:
+        ratings: The rating of every typist by ID. Typists without a rating
+            start at `RATING_INITIAL`.
+        contests: The number of rated contests of every typist by ID.
+        averages: The average WPM of every qualified typist of the contest,
+            by ID.
+
+    Returns:
+        dict[int, float]: The rating change of every typist of the contest,
+        by ID. Empty if fewer than two typists qualified.
+    """
+    typist_count = len(averages)
+    if typist_count < 2:
+        return {}
+
+    typist_ids = list(averages)
+    old_ratings = [
+        ratings.get(typist_id, RATING_INITIAL) for typist_id in typist_ids
+    ]
+    sorted_averages = sorted(averages.values())
+    rating_total = sum(old_ratings)
+
+    changes = {}
+    for typist_id, rating in zip(typist_ids, old_ratings, strict=True):
+        average = averages[typist_id]
+        beaten = bisect.bisect_left(sorted_averages, average)
+        tied = bisect.bisect_right(sorted_averages, average) - beaten - 1
+        score = (beaten + tied / 2) / (typist_count - 1)
+        field_rating = (rating_total - rating) / (typist_count - 1)
+        k_factor = (
+            RATING_PROVISIONAL_K_FACTOR
+            if contests.get(typist_id, 0) < RATING_PROVISIONAL_CONTESTS
+            else RATING_K_FACTOR
+        )
+        changes[typist_id] = k_factor * (
+            score - expected_score(rating, field_rating)
+        )
+
+    for typist_id, rating in zip(typist_ids, old_ratings, strict=True):
+        ratings[typist_id] = rating + changes[typist_id]
+        contests[typist_id] = contests.get(typist_id, 0) + 1
+    return changes
+
+
+class RatingBook:
+    """Persistent skill ratings of every typist across contests.
+
+    Each contest updates only the ratings of its own typists with
+    `rate_contest`, so ending a contest never replays earlier ones. The
+    results of every rated contest are appended to a history file as well,
+    which `recompute` replays to rebuild all ratings from scratch after a
+    change to the rating formula.
+
+    Attributes:
+        ratings_file_path: The path of the JSON file holding the ratings.
+        history_file_path: The path of the JSONL file holding the results of
+            every rated contest, oldest first.
+        ratings: The rating of every rated typist by ID.
+        contests: The number of rated contests of every rated typist by ID.
+    """
+
+    def __init__(self, ratings_file_path: str, history_file_path: str) -> None:
+        """Initialize the rating book from its file, if it exists.
+
+        Args:
+            ratings_file_path: The path of the JSON file holding the ratings.
+            history_file_path: The path of the JSONL file holding the results
+                of every rated contest.
+        """
+        self.ratings_file_path: str = ratings_file_path
+        self.history_file_path: str = history_file_path
+        self.ratings: dict[int, float] = {}
+        self.contests: dict[int, int] = {}
+        if os.path.exists(ratings_file_path):
+            with open(ratings_file_path) as file:
+                for typist_id, entry in json.load(file).items():
+                    self.ratings[int(typist_id)] = entry["rating"]
+                    self.contests[int(typist_id)] = entry["contests"]
+
+    def rating(self, typist_id: int) -> float:
+        """Return a typist's rating.
+
+        Args:
+            typist_id: The typist's ID.
+
+        Returns:
+            float: The rating, `RATING_INITIAL` for unrated typists.
+        """
+        return self.ratings.get(typist_id, RATING_INITIAL)
+
+    def rank(self, typist_id: int) -> int:
+        """Return a typist's rank among all rated typists.
+
+        Args:
+            typist_id: The ID of a rated typist.
+
+        Returns:
+            int: The rank, 1 for the highest rating.
+        """
+        rating = self.ratings[typist_id]
+        return 1 + sum(other > rating for other in self.ratings.values())
+
+    def record_contest(self, averages: dict[int, float]) -> dict[int, float]:
+        """Rate the typists of a finished contest and save the ratings.
+
+        Args:
+            averages: The average WPM of every qualified typist of the
+                contest, by ID.
+
+        Returns:
+            dict[int, float]: The rating change of every typist of the
+            contest, by ID. Empty if the contest was not rated.
+        """
+        changes = rate_contest(self.ratings, self.contests, averages)
+        if not changes:
+            return changes
+
+        record = {
+            "ended_at": datetime.now().isoformat(),
+            "averages": {
+                str(typist_id): average
+                for typist_id, average in averages.items()
+            },
+        }
+        with open(self.history_file_path, "a") as file:
+            file.write(json.dumps(record) + "\n")
+        self.save()
+        return changes
+
+    def recompute(self) -> int:
+        """Rebuild every rating from the history and save the ratings.
+
+        Returns:
+            int: The number of contests replayed.
+        """
+        self.ratings = {}
+        self.contests = {}
+        contest_count = 0
+        if os.path.exists(self.history_file_path):
+            with open(self.history_file_path) as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    averages = json.loads(line)["averages"]
+                    rate_contest(
+                        self.ratings,
+                        self.contests,
+                        {
+                            int(typist_id): average
+                            for typist_id, average in averages.items()
+                        },
+                    )
+                    contest_count += 1
+        self.save()
+        return contest_count
+
+    def save(self) -> None:
+        """Write the ratings to their file, replacing it atomically."""
+        temporary_path = f"{self.ratings_file_path}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(
+                {
+                    str(typist_id): {
+                        "rating": rating,
+                        "contests": self.contests[typist_id],
+                    }
+                    for typist_id, rating in self.ratings.items()
+                },
+                file,
+            )
+        os.replace(temporary_path, self.ratings_file_path)
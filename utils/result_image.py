@@ -0,0 +1,322 @@
+import asyncio
+import functools
+import hashlib
+import io
+import json
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from constants import (
+    RESULT_IMAGE_CACHE_SIZE,
+    RESULT_IMAGE_FONT,
+    RESULT_IMAGE_WORKERS,
+)
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:  # Pillow is an optional dependency
+    Image = ImageDraw = ImageFont = None
+
+FONT_SIZE = 18
+PADDING = 16
+CELL_PADDING = 10
+ROW_HEIGHT = 30
+PODIUM_STEP_HEIGHT = 40
+PODIUM_LABEL_HEIGHT = 48
+PODIUM_WIDTH = 160
+
+BACKGROUND_COLOR = (49, 51, 56)
+HEADER_COLOR = (88, 101, 242)
+STRIPE_COLOR = (43, 45, 49)
+TEXT_COLOR = (219, 222, 225)
+PODIUM_COLORS = [(255, 196, 0), (192, 192, 192), (205, 127, 50)]
+PODIUM_OTHER_COLOR = (128, 132, 142)
+
+
+def images_available() -> bool:
+    """Check whether result images can be rendered.
+
+    Returns:
+        bool: True if Pillow is installed.
+    """
+    return Image is not None
+
+
+@functools.lru_cache
+def load_font(size: int, bold: bool = False) -> "ImageFont.FreeTypeFont":
+    """Load the monospace font, once per process.
+
+    Args:
+        size: The font size in pixels.
+        bold: Whether to load the bold variant.
+
+    Returns:
+        ImageFont.FreeTypeFont: The font, or Pillow's default font if the
+        configured one is not installed.
+    """
+    name = RESULT_IMAGE_FONT.format(style="-Bold" if bold else "")
+    try:
+        return ImageFont.truetype(name, size)
+    except OSError:
+        return ImageFont.load_default(size)
+
+
+@functools.lru_cache(maxsize=32)
+def table_template(width: int, row_count: int, top: int) -> "Image.Image":
+    """Draw the background of a result table, once per size.
+
+    Args:
+        width: The image width.
+        row_count: The number of rows, header included.
+        top: The height reserved above the table for the podium.
+
+    Returns:
+        Image.Image: The background with the header band and row stripes.
+        Callers must draw on a copy.
+    """
+    height = top + row_count * ROW_HEIGHT + 2 * PADDING
+    image = Image.new("RGB", (width, height), BACKGROUND_COLOR)
+    draw = ImageDraw.Draw(image)
+    for row in range(row_count):
+        y = top + PADDING + row * ROW_HEIGHT
+        if row == 0:
+            color = HEADER_COLOR
+        elif row % 2 == 0:
+            color = STRIPE_COLOR
+        else:
+            continue
+        draw.rectangle(
+            (PADDING, y, width - PADDING - 1, y + ROW_HEIGHT - 1), fill=color
+        )
+    return image
+
+
+def podium_height(podium: list[tuple[str, float]]) -> int:
+    """Return the height of the podium drawn above the table.
+
+    Args:
+        podium: The top typists with their average WPM, best first.
+
+    Returns:
+        int: The podium height, 0 if there is no podium.
+    """
+    if not podium:
+        return 0
+    return PADDING + PODIUM_LABEL_HEIGHT + len(podium) * PODIUM_STEP_HEIGHT
+
+
+def draw_podium(
+    draw: "ImageDraw.ImageDraw",
+    podium: list[tuple[str, float]],
+    width: int,
+) -> None:
+    """Draw the podium, with the winner in the middle.
+
+    Args:
+        draw: The drawing context.
+        podium: The top typists with their average WPM, best first.
+        width: The image width.
+    """
+    font = load_font(FONT_SIZE)
+    bold_font = load_font(FONT_SIZE, bold=True)
+    bottom = podium_height(podium)
+    # Winner in the middle, runner-up on the left, everyone else on the right
+    order = [1, 0, *range(2, len(podium))] if len(podium) > 1 else [0]
+    left = (width - len(order) * PODIUM_WIDTH) // 2
+    for slot, rank in enumerate(order):
+        name, average_wpm = podium[rank]
+        x = left + slot * PODIUM_WIDTH
+        top = bottom - (len(podium) - rank) * PODIUM_STEP_HEIGHT
+        color = (
+            PODIUM_COLORS[rank]
+            if rank < len(PODIUM_COLORS)
+            else PODIUM_OTHER_COLOR
+        )
+        draw.rectangle(
+            (x + 4, top, x + PODIUM_WIDTH - 5, bottom - 1), fill=color
+        )
+        draw.text(
+            (x + PODIUM_WIDTH // 2, top + PODIUM_STEP_HEIGHT // 2),
+            str(rank + 1),
+            font=bold_font,
+            fill=BACKGROUND_COLOR,
+            anchor="mm",
+        )
+        draw.text(
+            (x + PODIUM_WIDTH // 2, top - PODIUM_LABEL_HEIGHT // 2),
+            f"{name[:14]}\n{average_wpm:.2f} WPM",
+            font=font,
+            fill=TEXT_COLOR,
+            anchor="mm",
+            align="center",
+        )
+
+
+def render_result_image(
+    wpm_result_rows: list[list[str]],
+    podium: list[tuple[str, float]],
+) -> bytes:
+    """Render a WPM result table, with an optional podium, as a PNG.
+
+    This is CPU-bound and runs in a worker process.
+
+    Args:
+        wpm_result_rows: The header row followed by one row per participant.
+        podium: The top typists with their average WPM, best first. Empty
+            for no podium.
+
+    Returns:
+        bytes: The PNG image.
+    """
+    font = load_font(FONT_SIZE)
+    bold_font = load_font(FONT_SIZE, bold=True)
+    column_widths = [
+        int(max(bold_font.getlength(item) for item in column))
+        + 2 * CELL_PADDING
+        for column in zip(*wpm_result_rows)
+    ]
+    width = max(
+        sum(column_widths) + 2 * PADDING,
+        len(podium) * PODIUM_WIDTH + 2 * PADDING,
+    )
+    top = podium_height(podium)
+
+    image = table_template(width, len(wpm_result_rows), top).copy()
+    draw = ImageDraw.Draw(image)
+    if podium:
+        draw_podium(draw, podium, width)
+
+    for row_index, row in enumerate(wpm_result_rows):
+        y = top + PADDING + row_index * ROW_HEIGHT + ROW_HEIGHT // 2
+        x = PADDING
+        for column_index, item in enumerate(row):
+            if column_index == 0:
+                anchor, item_x = "lm", x + CELL_PADDING
+            else:
+                anchor = "rm"
+                item_x = x + column_widths[column_index] - CELL_PADDING
+            draw.text(
+                (item_x, y),
+                item,
+                font=bold_font if row_index == 0 else font,
+                fill=TEXT_COLOR,
+                anchor=anchor,
+            )
+            x += column_widths[column_index]
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class ResultImageRenderer:
+    """Renders result images in a process pool and caches them.
+
+    Drawing never runs on the event loop: every image is rendered by
+    `render_result_image` in a worker process, where fonts and table
+    backgrounds are cached for the life of the worker. Finished images are
+    cached by a hash of the results, so an unchanged table is never rendered
+    twice, and concurrent requests for the same results share one render.
+
+    Attributes:
+        max_workers: The number of worker processes.
+        cache_size: The number of images kept in the cache.
+        executor: The process pool, started on the first render.
+        cache: The rendered images by results hash, least recently used
+            first.
+        pending: The renders in progress by results hash.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = RESULT_IMAGE_WORKERS,
+        cache_size: int = RESULT_IMAGE_CACHE_SIZE,
+    ) -> None:
+        """Initialize the renderer without starting the process pool.
+
+        Args:
+            max_workers: The number of worker processes.
+            cache_size: The number of images kept in the cache.
+        """
+        self.max_workers: int = max_workers
+        self.cache_size: int = cache_size
+        self.executor: ProcessPoolExecutor | None = None
+        self.cache: OrderedDict[str, bytes] = OrderedDict()
+        self.pending: dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def results_hash(
+        wpm_result_rows: list[list[str]],
+        podium: list[tuple[str, float]],
+    ) -> str:
+        """Hash the results an image is rendered from.
+
+        Args:
+            wpm_result_rows: The header row followed by one row per
+                participant.
+            podium: The top typists with their average WPM, best first.
+
+        Returns:
+            str: The hash of the results.
+        """
+        payload = json.dumps([wpm_result_rows, podium]).encode()
+        return hashlib.sha256(payload).hexdigest()
+
+    async def render(
+        self,
+        wpm_result_rows: list[list[str]],
+        podium: list[tuple[str, float]] | None = None,
+    ) -> bytes:
+        """Return the PNG of a result table, rendering it only if needed.
+
+        Args:
+            wpm_result_rows: The header row followed by one row per
+                participant.
+            podium: The top typists with their average WPM, best first.
+
+        Returns:
+            bytes: The PNG image.
+
+        Raises:
+            BrokenProcessPool: If a worker process died. The next render
+                starts a new pool.
+            Exception: Any error raised while rendering in the worker.
+        """
+        podium = podium or []
+        key = self.results_hash(wpm_result_rows, podium)
+        image = self.cache.get(key)
+        if image is not None:
+            self.cache.move_to_end(key)
+            return image
+
+        future = self.pending.get(key)
+        if future is None:
+            if self.executor is None:
+                # Spawned workers do not inherit the bot's event loop
+                self.executor = ProcessPoolExecutor(
+                    self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            future = asyncio.get_running_loop().run_in_executor(
+                self.executor, render_result_image, wpm_result_rows, podium
+            )
+            self.pending[key] = future
+            future.add_done_callback(lambda _: self.pending.pop(key, None))
+
+        try:
+            image = await asyncio.shield(future)
+        except BrokenProcessPool:
+            self.close()
+            raise
+        self.cache[key] = image
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return image
+
+    def close(self) -> None:
+        """Shut down the process pool."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
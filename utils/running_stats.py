@@ -0,0 +1,65 @@
+import math
+
+
+class RunningStats:
+    """Mean and variance of a stream of values, updated in O(1).
+
+    Uses Welford's online algorithm, so values are never stored or rescanned.
+    A value that was added can be removed again by reversing its update.
+
+    Attributes:
+        count: The number of values.
+        mean: The mean of the values.
+        m2: The sum of squared differences from the mean.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.count: int = 0
+        self.mean: float = 0.0
+        self.m2: float = 0.0
+
+    def add(self, value: float) -> None:
+        """Add a value.
+
+        Args:
+            value: The value to add.
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def remove(self, value: float) -> None:
+        """Remove a value that was added before.
+
+        Args:
+            value: The value to remove.
+        """
+        if self.count <= 1:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        delta = value - self.mean
+        self.count -= 1
+        self.mean -= delta / self.count
+        self.m2 = max(self.m2 - delta * (value - self.mean), 0.0)
+
+    @property
+    def std(self) -> float:
+        """The sample standard deviation, 0 for fewer than two values."""
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self.m2 / (self.count - 1))
+
+    def z_score(self, value: float, min_std: float) -> float:
+        """Return how many standard deviations a value is from the mean.
+
+        Args:
+            value: The value to score.
+            min_std: The smallest standard deviation to divide by, so a few
+                identical values do not make every other value an outlier.
+
+        Returns:
+            float: The absolute z-score of the value.
+        """
+        return abs(value - self.mean) / max(self.std, min_std)
@@ -0,0 +1,101 @@
+import asyncio
+import contextlib
+from collections.abc import Awaitable, Callable
+
+import discord
+
+from constants import SCOREBOARD_EDIT_INTERVAL_SECONDS
+
+
+class LiveScoreboard:
+    """A results message that is kept up to date by editing it in place.
+
+    Changes are only flagged with `mark_changed`, which is cheap and never
+    waits. A background task renders the scoreboard when something changed
+    and edits the message, at most once every `interval` seconds, so a burst
+    of `!wpm`s results in a single edit. A render identical to the current
+    content is not sent at all.
+
+    Attributes:
+        message: The scoreboard message.
+        render: Returns the current scoreboard content, or None once there is
+            nothing left to render.
+        interval: The minimum number of seconds between two edits.
+        content: The content the message currently shows.
+        changed: Set when the scoreboard needs to be rendered again.
+        task: The task rendering and editing the scoreboard.
+    """
+
+    def __init__(
+        self,
+        message: discord.Message,
+        render: Callable[[], Awaitable[str | None]],
+        interval: float = SCOREBOARD_EDIT_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize the scoreboard and start its task.
+
+        Args:
+            message: The scoreboard message, already sent.
+            render: Returns the current scoreboard content, or None once
+                there is nothing left to render.
+            interval: The minimum number of seconds between two edits.
+        """
+        self.message: discord.Message = message
+        self.render: Callable[[], Awaitable[str | None]] = render
+        self.interval: float = interval
+        self.content: str | None = message.content
+        self.changed: asyncio.Event = asyncio.Event()
+        self.task: asyncio.Task = asyncio.create_task(self.run())
+
+    def mark_changed(self) -> None:
+        """Flag that the scoreboard needs to be rendered again."""
+        self.changed.set()
+
+    async def run(self) -> None:
+        """Render and edit the scoreboard whenever it changed, throttled."""
+        while True:
+            await self.changed.wait()
+            self.changed.clear()
+            content = await self.render()
+            if content is None:
+                return
+            if await self.update(content):
+                await asyncio.sleep(self.interval)
+
+    async def update(self, content: str) -> bool:
+        """Edit the message unless it already shows the given content.
+
+        Args:
+            content: The new content.
+
+        Returns:
+            bool: True if the message was edited.
+        """
+        if content == self.content:
+            return False
+        try:
+            await self.message.edit(content=content)
+        except discord.HTTPException:
+            # Keep the old content so the next change tries again
+            return False
+        self.content = content
+        return True
+
+    async def pin(self) -> None:
+        """Pin the message, if the bot is allowed to."""
+        with contextlib.suppress(discord.HTTPException):
+            await self.message.pin()
+
+    async def close(self, content: str | None = None) -> None:
+        """Stop updating the scoreboard and unpin it.
+
+        Args:
+            content: The final content to show, if any.
+        """
+        self.task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self.task
+        if content is not None:
+            await self.update(content)
+        with contextlib.suppress(discord.HTTPException):
+            await self.message.unpin()
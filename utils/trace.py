@@ -0,0 +1,160 @@
+import json
+import time
+from typing import IO, Any
+
+import discord
+from discord.ext import commands
+
+
+def serialize_argument(argument: Any) -> Any:
+    """Convert a converted command argument into a JSON-compatible value.
+
+    Members and channels are stored by ID so that the replay tool can map
+    them back onto its fake objects, and lists such as greedy arguments are
+    stored item by item. Integers and omitted optional arguments (None) are
+    stored as they are, and every other argument as a string.
+
+    Args:
+        argument: The converted argument passed to the command.
+
+    Returns:
+        Any: A JSON-compatible representation of the argument.
+    """
+    if isinstance(argument, discord.abc.User):
+        return {"member": argument.id, "name": argument.display_name}
+    if isinstance(argument, discord.abc.GuildChannel):
+        return {"channel": argument.id}
+    if isinstance(argument, list):
+        return [serialize_argument(item) for item in argument]
+    if argument is None or isinstance(argument, int):
+        return argument
+    return str(argument)
+
+
+class TraceRecorder:
+    """Records incoming commands to a JSONL trace file.
+
+    Each line of the trace is a JSON object. Command records have the shape
+    `{"type": "command", "command": ..., "contest": ..., "author": ...,
+    "author_name": ..., "args": [...], "timestamp": ...}`, where the command
+    is its qualified name, such as "tournament start". Every contest that
+    ends writes a `{"type": "result", "contest": ..., "rows": [...]}` record
+    with its final result rows, and a final `{"type": "state", ...}` record
+    holds the state of the contests still running when the recorder was
+    closed, so a replay can check that it produces the same results and ends
+    in the same state.
+
+    A trace holds a single bot session: the file is overwritten when the
+    recorder is opened.
+
+    Attributes:
+        path: The path of the trace file.
+        file: The open trace file, or None once the recorder is closed.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Open the trace file, replacing any earlier trace.
+
+        Args:
+            path: The path of the trace file.
+        """
+        self.path: str = path
+        self.file: IO[str] | None = open(path, "w", encoding="utf-8")
+
+    def write(self, record: dict) -> None:
+        """Write a single record to the trace file.
+
+        Args:
+            record: The record to write.
+        """
+        if self.file is None:
+            return
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+
+    def record_command(self, ctx: commands.Context) -> None:
+        """Record a command invocation.
+
+        This should be called after argument conversion so that the
+        converted arguments are available on the context.
+
+        Args:
+            ctx: The command context.
+        """
+        # ctx.args holds the cog and the context before the real arguments
+        arguments = [serialize_argument(arg) for arg in ctx.args[2:]]
+        arguments.extend(serialize_argument(v) for v in ctx.kwargs.values())
+        self.write(
+            {
+                "type": "command",
+                "command": ctx.command.qualified_name,
+                "contest": ctx.channel.id,
+                "author": ctx.author.id,
+                "author_name": ctx.author.display_name,
+                "args": arguments,
+                "timestamp": time.time(),
+            }
+        )
+
+    def record_result(
+        self, channel_id: int, wpm_result_rows: list[list[str]]
+    ) -> None:
+        """Record the final results of a contest that ended.
+
+        Args:
+            channel_id: The ID of the contest channel.
+            wpm_result_rows: The header row followed by one row per
+                participant.
+        """
+        self.write(
+            {
+                "type": "result",
+                "contest": channel_id,
+                "rows": wpm_result_rows,
+                "timestamp": time.time(),
+            }
+        )
+
+    def record_state(self, state: dict) -> None:
+        """Record a snapshot of the contest state.
+
+        Args:
+            state: The snapshot returned by `TypingContestBot.snapshot_state`.
+        """
+        self.write({"type": "state", "state": state, "timestamp": time.time()})
+
+    def close(self) -> None:
+        """Close the trace file."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def load_trace(
+    path: str,
+) -> tuple[list[dict], dict[int, list[list[list[str]]]], dict | None]:
+    """Load a trace file written by `TraceRecorder`.
+
+    Args:
+        path: The path of the trace file.
+
+    Returns:
+        tuple: The command records in order, the result rows of every ended
+        contest by channel ID in the order the contests ended, and the last
+        recorded state snapshot, if any.
+    """
+    command_records = []
+    results: dict[int, list[list[list[str]]]] = {}
+    final_state = None
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record["type"] == "command":
+                command_records.append(record)
+            elif record["type"] == "result":
+                results.setdefault(record["contest"], []).append(record["rows"])
+            elif record["type"] == "state":
+                final_state = record["state"]
+    return command_records, results, final_state